@@ -0,0 +1,536 @@
+"""Benchmarks for grill.names hot paths.
+
+Run all of them with ``python benchmarks/bench_names.py``, or see ``--help`` for options to select benchmarks,
+scale their sizes and record results as JSON to compare against a previous run (e.g. from the last release)::
+
+    python benchmarks/bench_names.py --json baseline.json
+    python benchmarks/bench_names.py --json current.json --compare baseline.json
+"""
+import os
+import sys
+import json
+import asyncio
+import shutil
+import timeit
+import inspect
+import argparse
+import platform
+import tempfile
+import datetime
+import tracemalloc
+import subprocess
+
+from grill import names
+from grill.names import CGAsset, UsdAsset, CGAssetFile, DateTimeFile, LifeTR, NameIndex, AssetResolver, ParseCache
+from grill.tokens import ids
+
+_OPTIONS = dict(repeat=3)
+_RESULTS = []
+
+
+def _time(function, number=1):
+    """Best time (in seconds) of running `function` `number` times, out of the configured repeats."""
+    return min(timeit.repeat(function, number=number, repeat=_OPTIONS['repeat']))
+
+
+def _report(label, seconds, count, unit='name'):
+    per_unit = seconds / count * 1e6
+    _RESULTS.append(dict(name=label, unit=unit, count=count, seconds=seconds, us_per_unit=per_unit))
+    units = f'{unit[:-1]}ies' if unit.endswith('y') else f'{unit}s'
+    print(f"{label:<40} {per_unit:>10.3f} us per {unit} ({count} {units} in {seconds:.3f} s)")
+
+
+def _report_memory(label, size):
+    _RESULTS.append(dict(name=label, unit='byte', count=1, bytes=size))
+    print(f"{label:<40} {size:>10.0f} bytes per name")
+
+
+def _usd_names(count):
+    proto = UsdAsset.get_default()
+    return [proto.get(item=f'item{i % 1000}', version=i % 50 + 1) for i in range(count)]
+
+
+def bench_parse_many(count=100_000):
+    names = _usd_names(count)
+    _report("UsdAsset(name) loop", _time(lambda: [UsdAsset(n) for n in names]), count)
+    _report("UsdAsset.parse_many", _time(lambda: UsdAsset.parse_many(names)), count)
+
+
+def bench_paths_for(count=100_000):
+    rows = [dict(item=f'item{i % 1000}', version=i % 50 + 1) for i in range(count)]
+    _report("CGAssetFile.get_default(...).path loop", _time(lambda: [str(CGAssetFile.get_default(**r).path) for r in rows]), count)
+    _report("CGAssetFile.paths_for", _time(lambda: CGAssetFile.paths_for(rows)), count)
+
+
+def bench_freeze_memory(count=100_000):
+    names = _usd_names(count)
+
+    def allocated(factory):
+        tracemalloc.start()
+        try:
+            objects = factory()  # keep alive while measuring
+            return tracemalloc.get_traced_memory()[0] / len(objects)
+        finally:
+            tracemalloc.stop()
+
+    mutable = allocated(lambda: [UsdAsset(n) for n in names])
+    frozen = allocated(lambda: [UsdAsset(n).freeze() for n in names])
+    _report_memory("UsdAsset memory", mutable)
+    _report_memory("UsdAsset.freeze() memory", frozen)
+    _report("UsdAsset.freeze", _time(lambda: [UsdAsset(n).freeze() for n in names]), count)
+
+
+def bench_columns(count=100_000):
+    names = _usd_names(count)
+
+    def allocated(factory):
+        tracemalloc.start()
+        try:
+            result = factory()
+            traced = tracemalloc.get_traced_memory()[0] / count
+            del result  # only released once measured
+            return traced
+        finally:
+            tracemalloc.stop()
+
+    records = lambda: [UsdAsset(n).values for n in names]
+    _report_memory("UsdAsset(name).values records memory", allocated(records))
+    _report_memory("UsdAsset.to_columns memory", allocated(lambda: UsdAsset.to_columns(names)))
+    _report("UsdAsset(name).values records", _time(records), count)
+    _report("UsdAsset.to_columns", _time(lambda: UsdAsset.to_columns(names)), count)
+    columns = UsdAsset.to_columns(names)
+    _report("UsdAsset.from_columns", _time(lambda: UsdAsset.from_columns(columns)), count)
+    _report("UsdAsset.get(**values) loop", _time(lambda: [UsdAsset().get(**v) for v in records()]), count)
+
+
+def bench_short_names(count=100_000):
+    names = _usd_names(count)
+    short, codes = UsdAsset.to_short_many(names), {}
+    coded = UsdAsset.to_short_many(names, codes)
+    size = lambda strings: sum(len(s.encode()) for s in strings) / count
+    _report_memory("UsdAsset name size", size(names))
+    _report_memory("UsdAsset.to_short size", size(short))
+    _report_memory("UsdAsset.to_short size (codes)", size(coded) + len(json.dumps(codes)) / count)
+    _report("UsdAsset(name).to_short loop", _time(lambda: [UsdAsset(n).to_short() for n in names]), count)
+    _report("UsdAsset.to_short_many", _time(lambda: UsdAsset.to_short_many(names)), count)
+    _report("UsdAsset.to_short_many (codes)", _time(lambda: UsdAsset.to_short_many(names, {})), count)
+    _report("UsdAsset.from_short loop", _time(lambda: [UsdAsset.from_short(e).name for e in short]), count)
+    _report("UsdAsset.from_short_many", _time(lambda: UsdAsset.from_short_many(short)), count)
+    _report("UsdAsset.from_short_many (codes)", _time(lambda: UsdAsset.from_short_many(coded, codes)), count)
+
+
+def bench_name_index(count=100_000, queries=100):
+    names = _usd_names(count)
+    index = NameIndex(UsdAsset, names)
+    linear = lambda: [n for n in names if (lambda name: name.item == 'item7' and name.version == '8')(UsdAsset(n))]
+    _report("linear UsdAsset filter", _time(linear), 1, unit='query')
+    _report("NameIndex.query", _time(lambda: index.query(item='item7', version=8), number=queries), queries, unit='query')
+    _report("NameIndex.latest", _time(lambda: index.latest(item='item7'), number=queries), queries, unit='query')
+
+
+def bench_version_series(count=100_000):
+    names = _usd_names(count)
+
+    def latest_objects():
+        series = {}
+        for name in map(UsdAsset, names):
+            key = name.get(version=0)
+            if key not in series or int(name.version) > int(series[key].version):
+                series[key] = name
+        return series
+
+    _report("UsdAsset(name) loop + max per series", _time(latest_objects), count)
+    _report("UsdAsset.latest", _time(lambda: UsdAsset.latest(names)), count)
+    _report("UsdAsset.missing_versions", _time(lambda: UsdAsset.missing_versions(names)), count)
+
+
+def bench_scan(count=10_000):
+    root = tempfile.mkdtemp()
+    try:
+        for name in map(UsdAsset, _usd_names(count)):
+            path = os.path.join(root, name.path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, 'w').close()
+        os.makedirs(os.path.join(root, 'junk', 'deep', 'tree'))
+
+        def walk():
+            found = []
+            for directory, __, files in os.walk(root):
+                for filename in files:
+                    try:
+                        name = UsdAsset(filename)
+                    except ValueError:
+                        continue
+                    if os.path.join(root, name.path) == os.path.join(directory, filename):
+                        found.append(name)
+            return found
+
+        _report("os.walk + UsdAsset(name) loop", _time(walk), count)
+        _report("UsdAsset.scan", _time(lambda: list(UsdAsset.scan(root))), count)
+        _report("UsdAsset.scan(max_workers=8)", _time(lambda: list(UsdAsset.scan(root, max_workers=8))), count)
+    finally:
+        shutil.rmtree(root)
+
+
+def bench_resolver(count=5_000):
+    root = tempfile.mkdtemp()
+    try:
+        names = _usd_names(count)
+        for name in map(UsdAsset, names[::2]):  # half of them exist
+            path = os.path.join(root, name.path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, 'w').close()
+
+        def stat_loop():
+            paths = (os.path.join(root, UsdAsset(name).path) for name in names)
+            return [path if os.path.isfile(path) else None for path in paths]
+
+        async def resolve_many():
+            async with AssetResolver(root) as resolver:
+                return await resolver.resolve_many(names)
+
+        _report("UsdAsset(name).path + isfile loop", _time(stat_loop), count)
+        _report("AssetResolver.resolve_many", _time(lambda: asyncio.run(resolve_many())), count)
+    finally:
+        shutil.rmtree(root)
+
+
+def bench_anonymous(count=100_000, threads=8):
+    from concurrent import futures
+    _report("UsdAsset.get_anonymous loop", _time(lambda: [UsdAsset.get_anonymous() for _ in range(count)]), count, unit='id')
+    _report("UsdAsset.anonymous_batch", _time(lambda: UsdAsset.anonymous_batch(count)), count, unit='id')
+    with futures.ThreadPoolExecutor(threads) as executor:
+        batched = lambda: list(executor.map(UsdAsset.anonymous_batch, [count // threads] * threads))
+        _report(f"UsdAsset.anonymous_batch ({threads} threads)", _time(batched), count, unit='id')
+
+
+def bench_datetime_assign(count=20_000):
+    name = DateTimeFile("1999-10-28 22-29-31-926548.txt")
+
+    def one_by_one():
+        for i in range(count):
+            name.month = i % 12 + 1
+            name.day = i % 28 + 1
+
+    def invalid():
+        for _ in range(count):
+            try:
+                name.month = 13
+            except ValueError:
+                pass
+
+    _report("DateTimeFile field assignments", _time(one_by_one), count, unit='rename')
+    _report("DateTimeFile.update", _time(lambda: [name.update(month=i % 12 + 1, day=i % 28 + 1) for i in range(count)]), count, unit='rename')
+    _report("DateTimeFile invalid assignment", _time(invalid), count, unit='rename')
+
+
+def bench_timestamps(count=100_000, queries=1_000):
+    start = datetime.datetime(2000, 1, 1)
+    moments = [start + datetime.timedelta(minutes=i) for i in range(count)]
+    names = [f"{m.year}-{m.month}-{m.day} {m.hour}-{m.minute}-{m.second}-{m.microsecond}.log" for m in moments]
+    cutoff = moments[count // 2]
+    _report("DateTimeFile(name).datetime loop", _time(lambda: [DateTimeFile(n).datetime for n in names]), count)
+    _report("DateTimeFile.timestamps", _time(lambda: DateTimeFile.timestamps(names)), count)
+    _report("DateTimeFile.from_timestamps", _time(lambda: DateTimeFile.from_timestamps(DateTimeFile.timestamps(names), suffix='log')), count)
+    datetimes = [DateTimeFile(n).datetime for n in names]
+    timestamps = DateTimeFile.timestamps(names)
+    _report("linear cutoff filter", _time(lambda: [d for d in datetimes if d < cutoff], number=queries), queries, unit='query')
+    _report("DateTimeFile.time_slice", _time(lambda: names[DateTimeFile.time_slice(timestamps, stop=cutoff)], number=queries), queries, unit='query')
+
+
+def bench_threads(count=200_000, threads=(1, 2, 4, 8)):
+    """Parsing throughput per thread count. It only scales on free-threaded builds (e.g. python3.13t)."""
+    from concurrent import futures
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"{'GIL enabled':<40} {gil!s:>10}")
+    names = _usd_names(count)
+    UsdAsset.parse_many(names[:1])  # solve the convention before timing
+    for workers in threads:
+        chunks = [names[i::workers] for i in range(workers)]
+        with futures.ThreadPoolExecutor(workers) as executor:
+            parse = lambda: list(executor.map(UsdAsset.parse_many, chunks))
+            create = lambda: list(executor.map(lambda chunk: [UsdAsset(n) for n in chunk], chunks))
+            _report(f"UsdAsset.parse_many ({workers} threads)", _time(parse), count)
+            _report(f"UsdAsset(name) loop ({workers} threads)", _time(create), count)
+
+
+def bench_validate(count=200_000):
+    import io
+    import contextlib
+    from grill.names import __main__ as cli
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as names_file:
+        names_file.write('\n'.join(_usd_names(count)))
+    try:
+        for workers in (0, os.cpu_count()):
+            def validate():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    cli.main(['validate', '--type', 'UsdAsset', '--workers', str(workers), names_file.name])
+            _report(f"validate CLI ({workers} workers)", _time(validate), count)
+    finally:
+        os.remove(names_file.name)
+
+
+def bench_validation(count=20_000):
+    valid = _usd_names(count)
+    invalid = [f'{name}x' for name in valid]
+    asset = UsdAsset(valid[0])
+
+    def create(names):
+        for name in names:
+            try:
+                UsdAsset(name)
+            except ValueError:
+                pass
+
+    def set_suffix(suffix):
+        for _ in range(count):
+            try:
+                asset.suffix = suffix
+            except ValueError:
+                pass
+
+    _report("UsdAsset(name) valid", _time(lambda: create(valid)), count)
+    _report("UsdAsset(name) invalid", _time(lambda: create(invalid)), count)
+    _report("UsdAsset.is_valid valid", _time(lambda: [UsdAsset.is_valid(n) for n in valid]), count)
+    _report("UsdAsset.is_valid invalid", _time(lambda: [UsdAsset.is_valid(n) for n in invalid]), count)
+    _report("UsdAsset.suffix = invalid", _time(lambda: set_suffix('abc')), count)
+
+
+def bench_single_field(count=20_000):
+    for label, splice, verify in (("full", False, True), ("splice+verify", True, True), ("splice", True, False)):
+        asset = UsdAsset.get_default()
+        asset.SPLICE_FIELDS, asset.VERIFY_SPLICES = splice, verify
+
+        def mutate():
+            for i in range(count):
+                asset.version = i + 1
+                asset.area = 'model' if i % 2 else 'rig'
+
+        _report(f"UsdAsset field set ({label})", _time(mutate), count * 2, unit='set')
+
+
+def bench_metrics(count=50_000):
+    sources = _usd_names(count)
+    construct = lambda: [UsdAsset(name) for name in sources]
+    _report("UsdAsset(name) loop (metrics disabled)", _time(construct), count)
+    names.enable_metrics()
+    try:
+        _report("UsdAsset(name) loop (metrics enabled)", _time(construct), count)
+    finally:
+        names.disable_metrics()
+        names.metrics(reset=True)
+
+
+def bench_get_default(count=20_000):
+    for cls in (CGAsset, CGAssetFile, UsdAsset, DateTimeFile):
+        _report(f"{cls.__name__}.get_default", _time(lambda: [cls.get_default() for _ in range(count)]), count)
+
+
+def _deep_names(count):
+    """CGAssetFile names of a deep and wide hierarchy, with long values and optional fields present."""
+    proto = CGAssetFile.get_default()
+    return [
+        proto.get(
+            code=f'show{i % 7}', kingdom=f'kingdom{i % 13}', cluster=f'cluster{i % 29}', area=f'area{i % 31}',
+            item=f'a_rather_long_item_name_{i % 997}', variant=f'variant{i % 3}', output=f'output{i % 5}',
+            version=i % 120 + 1, index=i % 250, suffix=('exr', 'abc', 'usd', 'vdb')[i % 4],
+        ) for i in range(count)
+    ]
+
+
+def _suffix_variations(count):
+    proto = UsdAsset.get_default()
+    suffixes = ('usd', 'usda', 'usdc', 'usdz')
+    return [proto.get(item=f'item{i % 1000}', version=i % 50 + 1, suffix=suffixes[i % 4]) for i in range(count)]
+
+
+def _invalid_heavy(count, valid_ratio=0.1):
+    """Mostly invalid names: wrong suffixes, separators, missing fields and random files."""
+    names = _suffix_variations(count)
+    corruptions = (
+        lambda name: f'{name[:-4]}.abc',
+        lambda name: name.replace('-', '_', 3),
+        lambda name: name.split('-', 1)[1],
+        lambda name: 'thumbs.db',
+    )
+    step = int(1 / valid_ratio)
+    return [name if i % step == 0 else corruptions[i % len(corruptions)](name) for i, name in enumerate(names)]
+
+
+def bench_parse(count=50_000):
+    name_sets = [
+        ("CGAssetFile deep hierarchy", CGAssetFile, _deep_names(count)),
+        ("UsdAsset suffix variations", UsdAsset, _suffix_variations(count)),
+        ("UsdAsset invalid heavy", UsdAsset, _invalid_heavy(count)),
+        ("DateTimeFile", DateTimeFile, [
+            f"{2000 + i % 20}-{i % 12 + 1}-{i % 28 + 1} {i % 24}-{i % 60}-{i % 60}-{i}.log" for i in range(count)
+        ]),
+    ]
+    for label, cls, batch in name_sets:
+        def construct():
+            for name in batch:
+                try:
+                    cls(name)
+                except ValueError:
+                    pass
+
+        _report(f"{label}: construct", _time(construct), count)
+        _report(f"{label}: parse_many", _time(lambda: cls.parse_many(batch)), count)
+        _report(f"{label}: is_valid", _time(lambda: [cls.is_valid(name) for name in batch]), count)
+    taxa = [f'Eukarya:Animalia:Chordata:Mammalia:Primates:Hominidae:Homo:sapiens:form{i}' for i in range(count)]
+    _report("LifeTR: construct", _time(lambda: [LifeTR(name) for name in taxa]), count)
+
+
+def bench_segment_matching(count=50_000):
+    class Segmented(UsdAsset):
+        SEGMENT_MATCHING = True
+
+    near_misses = [f'{name}{"-x" * 20}.abc' for name in _suffix_variations(count)]  # long and invalid at the end
+    name_sets = [
+        ("suffix variations", _suffix_variations(count)),
+        ("invalid heavy", _invalid_heavy(count)),
+        ("near misses", near_misses),
+    ]
+    for label, batch in name_sets:
+        for cls in (UsdAsset, Segmented):
+            _report(f"{cls.__name__} {label}: parse_many", _time(lambda: cls.parse_many(batch)), count)
+            _report(f"{cls.__name__} {label}: is_valid", _time(lambda: [cls.is_valid(n) for n in batch]), count)
+
+
+def bench_parse_cache(count=100_000, unique_ratio=0.05):
+    class Cached(UsdAsset):
+        PARSE_CACHE = ParseCache(maxsize=10_000)
+
+    unique = _usd_names(int(count * unique_ratio))
+    names = [unique[i % len(unique)] for i in range(count)]
+    _report("UsdAsset(name) loop (95% repeats)", _time(lambda: [UsdAsset(n) for n in names]), count)
+    _report("UsdAsset(name) loop (95% repeats, ParseCache)", _time(lambda: [Cached(n) for n in names]), count)
+    _report("UsdAsset.parse loop (95% repeats)", _time(lambda: [UsdAsset.parse(n) for n in names]), count)
+    _report("UsdAsset.parse loop (95% repeats, ParseCache)", _time(lambda: [Cached.parse(n) for n in names]), count)
+
+
+def bench_path(count=50_000):
+    names = [CGAssetFile(name) for name in _deep_names(count)]
+    _report("CGAssetFile.path (deep hierarchy)", _time(lambda: [name.path for name in names]), count)
+
+
+def bench_datetime(count=50_000):
+    names = [DateTimeFile(f"{2000 + i % 20}-{i % 12 + 1}-{i % 28 + 1} {i % 24}-{i % 60}-{i % 60}-{i}.log") for i in range(count)]
+    _report("DateTimeFile.datetime", _time(lambda: [name.datetime for name in names]), count)
+
+
+def bench_tokens(count=200):
+    tempdir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(os.path.dirname(ids.__file__), 'CGAsset.cfg')
+        cfg_path = os.path.join(tempdir, 'Bench.cfg')
+        shutil.copy(source, cfg_path)
+
+        def parse():
+            shutil.rmtree(os.path.join(tempdir, '__pycache__'), ignore_errors=True)
+            ids._load_sections(cfg_path)
+
+        _report("ids token file load (no cache)", _time(lambda: [parse() for _ in range(count)]), count, unit='load')
+        _report("ids token file load (cached)", _time(lambda: [ids._load_sections(cfg_path) for _ in range(count)]), count, unit='load')
+        _report("ids token enum creation", _time(lambda: [ids._register('Bench', cfg_path) for _ in range(count)]), count, unit='load')
+        ids._registry.pop('Bench', None)
+        _report("ids attribute lookup", _time(lambda: [ids.CGAsset for _ in range(count * 1000)]), count * 1000, unit='lookup')
+    finally:
+        ids._registry.pop('Bench', None)
+        shutil.rmtree(tempdir)
+
+
+def bench_import(count=10):
+    command = [sys.executable, '-X', 'importtime', '-c', 'import grill.names']
+    cumulative = []
+    for _ in range(count):
+        stderr = subprocess.run(command, capture_output=True, text=True, check=True).stderr
+        line = next(line for line in stderr.splitlines() if line.endswith('| grill.names'))
+        cumulative.append(int(line.split('|')[1]))  # microseconds
+    _report(f"import grill.names (best of {count})", min(cumulative) / 1e6, 1, unit='import')
+
+
+_BENCHMARKS = [
+    bench_import, bench_tokens, bench_get_default, bench_parse, bench_path, bench_datetime,
+    bench_parse_many, bench_paths_for, bench_freeze_memory, bench_name_index, bench_scan, bench_anonymous,
+    bench_datetime_assign, bench_timestamps, bench_threads, bench_validate, bench_validation, bench_single_field,
+    bench_metrics, bench_version_series, bench_resolver, bench_columns, bench_segment_matching,
+    bench_parse_cache, bench_short_names,
+]
+
+
+def _metadata():
+    from importlib import metadata
+    versions = {}
+    for distribution in ('grill-names', 'naming'):
+        try:
+            versions[distribution] = metadata.version(distribution)
+        except metadata.PackageNotFoundError:
+            versions[distribution] = None
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, cwd=os.path.dirname(__file__),
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return dict(
+        date=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        python=sys.version,
+        implementation=platform.python_implementation(),
+        gil=getattr(sys, '_is_gil_enabled', lambda: True)(),
+        platform=platform.platform(),
+        machine=platform.machine(),
+        cpu_count=os.cpu_count(),
+        versions=versions,
+        commit=commit,
+        repeat=_OPTIONS['repeat'],
+    )
+
+
+def _compare(baseline_path, threshold):
+    """Print the change of each result against the ones in `baseline_path`. Get whether any regressed."""
+    with open(baseline_path) as baseline_file:
+        baseline = {result['name']: result for result in json.load(baseline_file)['results']}
+    regressed = False
+    print(f"\n{'Benchmark':<40} {'baseline':>12} {'current':>12} {'change':>8}")
+    for result in _RESULTS:
+        previous = baseline.get(result['name'])
+        key = 'bytes' if 'bytes' in result else 'us_per_unit'
+        if not previous or not previous.get(key):
+            continue
+        change = result[key] / previous[key] - 1
+        flag = ''
+        if change > threshold:
+            regressed = True
+            flag = ' slower' if key == 'us_per_unit' else ' larger'
+        print(f"{result['name']:<40} {previous[key]:>12.3f} {result[key]:>12.3f} {change:>+8.1%}{flag}")
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-k', '--select', action='append', help='Only run benchmarks whose name contains this.')
+    parser.add_argument('--scale', type=float, default=1.0, help='Multiply the default size of every benchmark.')
+    parser.add_argument('--repeat', type=int, default=_OPTIONS['repeat'], help='Timing repetitions (best is kept).')
+    parser.add_argument('--json', help='Write metadata and results to this JSON file.')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare against.')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Relative change considered a regression.')
+    arguments = parser.parse_args(argv)
+    _OPTIONS['repeat'] = arguments.repeat
+
+    for benchmark in _BENCHMARKS:
+        if arguments.select and not any(selected in benchmark.__name__ for selected in arguments.select):
+            continue
+        count = inspect.signature(benchmark).parameters['count'].default
+        benchmark(count=max(1, int(count * arguments.scale)))
+
+    if arguments.json:
+        with open(arguments.json, 'w') as json_file:
+            json.dump(dict(metadata=_metadata(), results=_RESULTS), json_file, indent=2)
+    if arguments.compare:
+        return int(_compare(arguments.compare, arguments.threshold))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
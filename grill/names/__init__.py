@@ -1,20 +1,120 @@
 from __future__ import annotations
 
-import uuid
+import os
+import re
+import sys
+import types
+import array
+import bisect
+import pathlib
+import typing
+import time
+import weakref
+import threading
+import contextlib
+import functools
+import operator
 import itertools
-import collections
-from datetime import datetime
+import collections.abc
+from datetime import datetime, timedelta, timezone
 
 import naming
-try:
-    from pxr import Sdf
-    _USD_SUFFIXES = tuple(ext for ext in Sdf.FileFormat.FindAllFileFormatExtensions() if ext.startswith('usd'))
-except ImportError:  # Don't fail if Sdf is not importable to facilitate portability
-    _USD_SUFFIXES = ("usd", "usda", "usdc", "usdz", "usdt")
 
 from grill.tokens import ids
 
 
+@functools.lru_cache(maxsize=None)
+def _usd_suffixes() -> typing.Tuple[str, ...]:
+    # Probing Sdf loads all USD plugins, so it is deferred until the first UsdAsset pattern is solved.
+    try:
+        from pxr import Sdf
+        return tuple(ext for ext in Sdf.FileFormat.FindAllFileFormatExtensions() if ext.startswith('usd'))
+    except ImportError:  # Don't fail if Sdf is not importable to facilitate portability
+        return ("usd", "usda", "usdc", "usdz", "usdt")
+
+
+def __getattr__(name):
+    if name == '_USD_SUFFIXES':
+        return _usd_suffixes()
+    raise AttributeError(f"module {__name__} has no attribute {name}")
+
+
+class _USDSuffixConfig(collections.abc.Mapping):
+    """Config for the ``suffix`` field of USD files, solved on first access."""
+
+    def __getitem__(self, key):
+        if key != 'suffix':
+            raise KeyError(key)
+        return "|".join(_usd_suffixes())
+
+    def __iter__(self):
+        yield 'suffix'
+
+    def __len__(self):
+        return 1
+
+
+class _TokensDoc:
+    """Class docstring followed by a table of tokens from :mod:`grill.tokens.ids`, generated on first access."""
+
+    def __init__(self, doc: str, token_ids: str):
+        self.doc = doc
+        self.token_ids = token_ids
+        self._solved = None
+
+    def __get__(self, obj, objtype=None) -> str:
+        token_ids = getattr(ids, self.token_ids)
+        if self._solved is None or self._solved[0] is not token_ids:  # tokens may have been reloaded
+            self._solved = token_ids, f"{self.doc}\n{_table_from_id(token_ids)}\n"
+        return self._solved[1]
+
+
+# {name class: config declared on its body}, to solve configs again when the tokens they derive from change
+_DECLARED_CONFIGS = weakref.WeakKeyDictionary()
+
+
+def _declare_config(cls):
+    config = vars(cls).get('config', {})
+    if not isinstance(config, naming.NameConfig):  # solved configs are already tracked
+        _DECLARED_CONFIGS[cls] = config
+
+
+def _config_from_tokens(token_ids) -> dict:
+    return {token.name: token.value.pattern for token in token_ids}
+
+
+def _reload_token_configs(changed: typing.FrozenSet[str]):
+    """Solve configs again for classes deriving from `changed` token ids (and their subclasses)."""
+    stale = set()
+    to_visit = [DefaultName, LifeTR]
+    while to_visit:
+        cls = to_visit.pop()
+        if cls in stale or vars(cls).get('_token_ids') in changed:
+            stale.add(cls)
+            stale.update(cls.__subclasses__())
+        to_visit.extend(cls.__subclasses__())
+    # bases are solved first: a class mro is always longer than the ones of its bases
+    for cls in sorted(stale, key=lambda c: len(c.mro())):
+        if '_token_ids' in vars(cls):
+            declared = _config_from_tokens(getattr(ids, cls._token_ids))
+        else:
+            declared = _DECLARED_CONFIGS.get(cls, {})
+        # merge the new config the same way naming does on __init_subclass__, without changing the current one
+        merged = {}
+        for base in reversed(cls.mro()):
+            merged.update(declared if base is cls else getattr(base, 'config', {}))
+        for dropped in cls.drop:
+            merged.pop(dropped, None)
+        # new fields need a descriptor before the config using them is published
+        field_value = _FieldValue if issubclass(cls, DefaultName) else naming.base.FieldValue
+        for field in merged.keys() - {name for base in cls.mro() for name in vars(base)}:
+            setattr(cls, field, getattr(cls, '_field_values', {}).get(field, field_value)(field))
+        config = naming.NameConfig(merged, 'config')
+        with _CONVENTIONS_LOCK:  # a single assignment: readers get either the previous config or the new one
+            cls.config = config
+    _DEFAULT_NAMES.clear()  # token defaults may have changed too
+
+
 def _table_from_id(token_ids):
     headers = [
         'Token',
@@ -54,6 +154,588 @@ def _table_from_id(token_ids):
     return '\n'.join(format_rows)
 
 
+class ParsedNames(typing.NamedTuple):
+    """Column oriented field values of names parsed in bulk via :meth:`grill.names.DefaultName.parse_many`.
+
+    ``fields`` maps every field of the convention to a list of values (one per parsed name), ``mask`` is ``True``
+    for every name that is not valid under the convention (all its field values are ``None``).
+    """
+    fields: typing.Dict[str, list]
+    mask: typing.List[bool]
+
+
+class NameColumns(typing.NamedTuple):
+    """Dictionary encoded field values of names exported in bulk via :meth:`grill.names.DefaultName.to_columns`.
+
+    ``codes`` maps every field of the convention (except compound ones, which are solved from their members) to an
+    :class:`array.array` of ``int32`` codes, one per name. Each code is the position of the value of the name on the
+    ``categories`` of the field, or ``-1`` when missing (optional fields, invalid names). ``mask`` is ``1`` for every
+    name that is not valid under the convention.
+
+    Codes and categories map directly to categorical (dictionary) columns of other tools, e.g.
+    ``pyarrow.DictionaryArray.from_arrays(codes, categories, mask=...)`` or
+    ``pandas.Categorical.from_codes(codes, categories)``.
+
+    Example:
+        >>> columns = UsdAsset.to_columns(UsdAsset.get_default(area=area).name for area in ('model', 'rig', 'model'))
+        >>> columns.codes['area']
+        array('i', [0, 1, 0])
+        >>> columns.categories['area']
+        ('model', 'rig')
+        >>> columns.value_counts('area')
+        {'model': 2, 'rig': 1}
+    """
+    codes: typing.Dict[str, array.array]
+    categories: typing.Dict[str, typing.Tuple[str, ...]]
+    mask: array.array
+
+    def values(self, field: str) -> typing.List[typing.Optional[str]]:
+        """Get the values of `field`, one per name (``None`` when missing)."""
+        categories = (*self.categories[field], None)  # missing values have a -1 code
+        return list(map(categories.__getitem__, self.codes[field]))
+
+    def value_counts(self, field: str) -> typing.Dict[str, int]:
+        """Get how many names have each value of `field`, from the most to the least common."""
+        categories = self.categories[field]
+        counts = collections.Counter(self.codes[field]).most_common()
+        return {categories[code]: count for code, count in counts if code >= 0}
+
+    def to_numpy(self):
+        """Get the codes as a :class:`numpy.ndarray` structured array, with an ``int32`` column per field.
+
+        Requires ``numpy``. Categories of the codes remain on ``categories``.
+        """
+        import numpy
+        result = numpy.empty(len(self.mask), dtype=[(field, numpy.int32) for field in self.codes])
+        for field, codes in self.codes.items():
+            result[field] = codes
+        return result
+
+
+class ParseCache:
+    """Bounded cache of the field values of parsed name strings, discarding the least recently used ones.
+
+    Enabled per name class via :attr:`grill.names.DefaultName.PARSE_CACHE`. Entries are keyed by name class,
+    convention pattern and name string, so changes to a convention (e.g. reloaded tokens) do not reuse stale values.
+    Safe to share across threads.
+
+    :param maxsize: Maximum name strings to keep.
+
+    Example:
+        >>> cache = UsdAsset.PARSE_CACHE = ParseCache(maxsize=2)
+        >>> UsdAsset('demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda').version
+        '1'
+        >>> UsdAsset('demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda').area
+        'rnd'
+        >>> cache.info()
+        {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 2}
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: typing.Hashable) -> typing.Optional[typing.Dict[str, typing.Optional[str]]]:
+        """Get the values cached for `key` (marking them as recently used), or None if missing."""
+        with self._lock:
+            try:
+                values = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return values
+
+    def put(self, key: typing.Hashable, values: typing.Dict[str, typing.Optional[str]]):
+        """Cache `values` for `key`, discarding the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = values
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def info(self) -> typing.Dict[str, int]:
+        """Get the ``hits``, ``misses``, current ``size`` and ``maxsize`` of this cache."""
+        with self._lock:
+            return dict(hits=self.hits, misses=self.misses, size=len(self._entries), maxsize=self.maxsize)
+
+    def clear(self):
+        """Discard all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+class FrozenName:
+    """Immutable and hashable snapshot of a :class:`grill.names.DefaultName` object.
+
+    Created via :meth:`grill.names.DefaultName.freeze` and turned back into a name object via
+    :meth:`grill.names.DefaultName.thaw`. Field values are interned and accessible as attributes or items
+    (``None`` when missing). Snapshots have no other public members, so no field is shadowed by them.
+
+    Example:
+        >>> frozen = UsdAsset.get_default(area='model', output='cache', index=3).freeze()
+        >>> frozen.area, frozen.index, frozen['output']
+        ('model', '3', 'cache')
+        >>> UsdAsset.thaw(frozen)
+        UsdAsset("demo-3d-abc-entity-model-main-atom-lead-base-whole.cache.1.3.usd")
+    """
+    __slots__ = ('_type', '_sep', '_fields', '_values')
+
+    def __init__(
+            self,
+            type: type,
+            sep: str,
+            fields: typing.Tuple[str, ...],  # shared by all snapshots of the same class and separator
+            values: typing.Tuple[typing.Optional[str], ...],
+    ):
+        for attr, value in zip(self.__slots__, (type, sep, fields, values)):
+            object.__setattr__(self, attr, value)
+
+    def __getitem__(self, field: str) -> typing.Optional[str]:
+        try:
+            return self._values[self._fields.index(field)]
+        except ValueError:
+            raise KeyError(field) from None
+
+    def __getattr__(self, field):
+        try:
+            return self[field]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{field}'") from None
+
+    def __setattr__(self, attr, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    __delattr__ = __setattr__
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __reduce__(self):
+        return type(self), self._key()
+
+    def __repr__(self):
+        values = ', '.join(f'{field}={value!r}' for field, value in zip(self._fields, self._values))
+        return f'{type(self).__name__}({self._type.__name__}, sep={self._sep!r}, {values})'
+
+    def _key(self) -> tuple:
+        return self._type, self._sep, self._fields, self._values
+
+
+class _Convention(typing.NamedTuple):
+    configs: tuple  # config mappings the pattern was solved from, to detect changes
+    regex: typing.Pattern
+    fields: typing.Tuple[str, ...]
+    indices: typing.Tuple[int, ...]
+    patterns: typing.Dict[str, typing.Pattern]  # {field: pattern of its group}
+    groups: typing.Dict[int, str]  # {group index: field}
+    matcher: typing.Optional[_SegmentMatcher]  # equivalent to `regex`, when the convention can be split on separators
+
+
+_NAMED_GROUP = re.compile(r'\(\?P<(\w+)>')
+
+
+def _group_patterns(pattern: str) -> typing.Dict[str, str]:
+    """Get the {name: pattern} contents of every named group in the regular expression `pattern`."""
+    result = {}
+    opened = []  # [(group name or None, contents start), ...]
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\':  # skip escaped character
+            index += 1
+        elif char == '[':  # skip character set, where "]" right after the opening (or negation) is a literal
+            index += 2 if pattern.startswith('^', index + 1) else 1
+            index += pattern.startswith(']', index)
+            while pattern[index] != ']':
+                index += 2 if pattern[index] == '\\' else 1
+        elif char == '(':
+            named = _NAMED_GROUP.match(pattern, index)
+            opened.append((named.group(1), named.end()) if named else (None, index + 1))
+        elif char == ')':
+            name, start = opened.pop()
+            if name:
+                result[name] = pattern[start:index]
+        index += 1
+    return result
+
+
+_MARKER = re.compile('\0(\\d+)\0')
+
+_call = getattr(operator, 'call', lambda function, arg: function(arg))  # operator.call is new in python 3.11
+_LITERALS = re.compile(r'\w+(?:\|\w+)*')  # e.g. "usd|usda|usdc", matched by a set of the alternatives
+
+
+@functools.lru_cache(maxsize=None)
+def _regex_parser() -> types.SimpleNamespace:
+    """Get the parser of regular expressions of the standard library, with the opcodes used by :func:`_excludes`.
+
+    The parser is private and its opcodes may change between python versions, so it is only imported when segment
+    matching is solved. Raises ImportError or AttributeError when it is not found.
+    """
+    try:
+        from re import _parser as parser  # python >= 3.11
+    except ImportError:
+        import sre_parse as parser
+    categories = (
+        ('DIGIT', r'\d'), ('NOT_DIGIT', r'\D'), ('SPACE', r'\s'), ('NOT_SPACE', r'\S'), ('WORD', r'\w'), ('NOT_WORD', r'\W'),
+    )
+    return types.SimpleNamespace(
+        parse=parser.parse,
+        **{op: getattr(parser, op) for op in ('LITERAL', 'IN', 'RANGE', 'CATEGORY', 'SUBPATTERN', 'BRANCH')},
+        repeats={parser.MAX_REPEAT, parser.MIN_REPEAT, getattr(parser, 'POSSESSIVE_REPEAT', None)},
+        categories={getattr(parser, f'CATEGORY_{name}'): re.compile(escape).match for name, escape in categories},
+    )
+
+
+def _excludes(pattern: str, chars: typing.Set[str]) -> bool:
+    """Whether strings matched by the regular expression `pattern` never contain any of `chars`.
+
+    False when unsure, e.g. for patterns with any character (``.``), anchors, lookarounds, references or flags,
+    which may also match differently on a substring than as part of a bigger pattern.
+    """
+    parser = _regex_parser()
+    try:
+        if re.compile(pattern).flags & ~re.UNICODE:
+            return False
+        return _excluded(parser, parser.parse(pattern), chars)
+    except re.error:
+        return False
+
+
+def _excluded(parser: types.SimpleNamespace, items, chars: typing.Set[str]) -> bool:
+    for op, av in items:
+        if op == parser.LITERAL:
+            excluded = chr(av) not in chars
+        elif op == parser.IN:
+            excluded = all(_set_item_excluded(parser, item_op, item_av, chars) for item_op, item_av in av)
+        elif op in parser.repeats:
+            excluded = _excluded(parser, av[2], chars)
+        elif op == parser.SUBPATTERN:
+            excluded = not (av[1] or av[2]) and _excluded(parser, av[3], chars)  # (group, add flags, del flags, items)
+        elif op == parser.BRANCH:
+            excluded = all(_excluded(parser, branch, chars) for branch in av[1])
+        else:
+            return False
+        if not excluded:
+            return False
+    return True
+
+
+def _set_item_excluded(parser: types.SimpleNamespace, op, av, chars: typing.Set[str]) -> bool:
+    if op == parser.LITERAL:
+        return chr(av) not in chars
+    if op == parser.RANGE:
+        return not any(av[0] <= ord(char) <= av[1] for char in chars)
+    if op == parser.CATEGORY and av in parser.categories:
+        return not any(map(parser.categories[av], chars))
+    return False  # e.g. negated sets
+
+
+class _SegmentMatcher:
+    """Match names by splitting them on their separators, checking the value of every field on its own.
+
+    Checks are a set lookup for fields that are an alternation of words (e.g. suffixes), or a match of the field
+    pattern. Built by :func:`_segment_matcher` only for conventions where no field value can contain a separator,
+    so splitting names is unambiguous and gives the same values as matching the whole convention pattern.
+    """
+
+    def __init__(self, sep, head, join_sep, pipe, suffix):
+        self.sep = sep
+        self.head = head  # [(field, check, None) or (compound field, None, ((member, check), ...)), ...]
+        self.size = len(head)
+        # without compounds, fields are checked all at once
+        self.leaves = None if any(members for *__, members in head) else tuple(field for field, *__ in head)
+        self.checks = tuple(check for __, check, __ in head)
+        self.join_sep = join_sep
+        self.pipe = pipe  # (pipe separator, output check, version check, index check) of naming.Pipe classes
+        self.suffix = suffix  # suffix check of naming.File classes
+
+    def __call__(self, name: str) -> typing.Optional[typing.Dict[str, typing.Optional[str]]]:
+        """Get the values of every field of `name` (like :meth:`re.Match.groupdict`), or None if it is not valid."""
+        if name.endswith('\n'):  # like `$`, which also matches right before a trailing new line
+            name = name[:-1]
+        rest = name
+        if self.suffix is not None:
+            rest, dot, suffix = name.rpartition('.')
+            if not dot or not self.suffix(suffix):
+                return None
+        head = rest
+        if self.pipe is not None:
+            pipe_sep, output, version, index = self.pipe
+            head, *pieces = rest.split(pipe_sep)
+            count = len(pieces)
+            # same precedence as the pattern: (sep output)? sep version (sep index)?
+            if count == 1:
+                candidates = ((None, pieces[0], None),)
+            elif count == 2:
+                candidates = ((pieces[0], pieces[1], None), (None, pieces[0], pieces[1]))
+            elif count == 3:
+                candidates = (tuple(pieces),)
+            else:
+                return None
+            for pipe_values in candidates:
+                output_value, version_value, index_value = pipe_values
+                if (output_value is None or output(output_value)) and version(version_value) and (
+                        index_value is None or index(index_value)):
+                    break
+            else:
+                return None
+        segments = head.split(self.sep)
+        if len(segments) != self.size:
+            return None
+        if self.leaves:
+            if not all(map(_call, self.checks, segments)):
+                return None
+            values = dict(zip(self.leaves, segments))
+        else:
+            values = self._compound_values(segments)
+            if values is None:
+                return None
+        if self.pipe is not None:
+            values['pipe'] = rest[len(head):]
+            values['output'], values['version'], values['index'] = pipe_values
+        if self.suffix is not None:
+            values['suffix'] = suffix
+        return values
+
+    def _compound_values(self, segments: typing.List[str]) -> typing.Optional[typing.Dict[str, str]]:
+        values = {}
+        for (field, check, members), segment in zip(self.head, segments):
+            if members is None:
+                if not check(segment):
+                    return None
+                values[field] = segment
+                continue
+            parts = segment.split(self.join_sep)
+            if len(parts) != len(members):
+                return None
+            values[field] = segment
+            for (member, check), part in zip(members, parts):
+                if not check(part):
+                    return None
+                values[member] = part
+        return values
+
+
+def _segment_matcher(
+        name: DefaultName, pattern: str, groups: typing.Dict[str, str],
+) -> typing.Optional[_SegmentMatcher]:
+    """Get a matcher equivalent to the convention `pattern` of `name`, or None if it can't be split on separators.
+
+    The matcher assumes the layout of the convention (fields joined by `sep`, compounds by `join_sep`, then the pipe
+    of naming.Pipe and the suffix of naming.File), so it is only built when that layout gives the same `pattern`.
+    It is not built either when the regular expression parser of this python is not the expected one.
+    """
+    sep, join_sep = name.sep, name.join_sep
+    cast = lambda field: rf'(?P<{field}>{groups.get(field)})'
+    head, expected, order = [], [], []
+    separators = {sep}
+    for field in name.get_pattern_list():
+        members = name.join.get(field)
+        head.append((field, members))
+        order.append(field)
+        if members:
+            separators.add(join_sep)
+            order.extend(members)
+            expected.append(rf'(?P<{field}>{join_sep.join(map(cast, members))})')
+        else:
+            expected.append(cast(field))
+    expected = name._separator_pattern.join(expected)
+    pipe_sep = None
+    if isinstance(name, naming.Pipe):
+        pipe_sep = name.pipe_sep
+        escaped = re.escape(pipe_sep)
+        expected += rf'(?P<pipe>({escaped}{cast("output")})?{escaped}{cast("version")}({escaped}{cast("index")})?)'
+        order.extend(('pipe', 'output', 'version', 'index'))
+    if isinstance(name, naming.File):
+        expected += rf'(\.{cast("suffix")})'
+        order.append('suffix')
+    if pattern != expected or tuple(order) != tuple(re.compile(pattern).groupindex):
+        return None
+    if not sep or any(set(a) & set(b) for a, b in itertools.combinations(filter(None, (*separators, pipe_sep)), 2)):
+        return None  # splitting on one separator would split on another
+    chars = set(''.join(separators)) | set(pipe_sep or '') | {'.', '\n'}
+    leaves = {field for field, members in head if not members}.union(*(members or () for __, members in head))
+    leaves.update(['output', 'version', 'index'] if pipe_sep else [])
+    leaves.update(['suffix'] if isinstance(name, naming.File) else [])
+    try:
+        parser = _regex_parser()
+        if join_sep in separators and not all(op == parser.LITERAL for op, __ in parser.parse(join_sep)):
+            return None  # joined compound members are not escaped
+        if not all(_excludes(groups[field], chars) for field in leaves):
+            return None
+    except Exception:  # e.g. the private parser changed on a new python version: match the whole pattern instead
+        return None
+    checks = {
+        field: frozenset(groups[field].split('|')).__contains__ if _LITERALS.fullmatch(groups[field])
+        else re.compile(groups[field]).fullmatch
+        for field in leaves
+    }
+    return _SegmentMatcher(
+        sep,
+        [
+            (field, None, tuple((member, checks[member]) for member in members)) if members
+            else (field, checks[field], None)
+            for field, members in head
+        ],
+        join_sep,
+        (pipe_sep, checks['output'], checks['version'], checks['index']) if pipe_sep else None,
+        checks['suffix'] if isinstance(name, naming.File) else None,
+    )
+
+# {name class: {separator: _Convention}}, shared by all instances of a class using the same separator
+_CONVENTIONS = weakref.WeakKeyDictionary()
+_CONVENTIONS_LOCK = threading.Lock()
+# {name class: ((convention, default suffix), state of its default name)}
+_DEFAULT_NAMES = weakref.WeakKeyDictionary()
+# {name class: ((token ids, convention, default suffix), _ShortLayout)}
+_SHORT_LAYOUTS = weakref.WeakKeyDictionary()
+
+
+class _ShortLayout(typing.NamedTuple):
+    """Fields of short names, in the order they are encoded."""
+    fields: typing.Tuple[str, ...]
+    keys: typing.Tuple[str, ...]  # short name of the token of each field, or the field itself
+    defaults: typing.Tuple[typing.Optional[str], ...]  # omitted from short names
+    coded: typing.Tuple[bool, ...]  # dictionary coded when codes are given
+
+
+class NameValidationError(ValueError):
+    """Raised when setting an invalid name or field value on a :class:`grill.names.DefaultName` object.
+
+    Its message is formatted only when needed (e.g. when printed), as well as the lookup of the failing field for
+    invalid name strings, so rejecting a name costs about as much as accepting one.
+
+    Example:
+        >>> asset_id = UsdAsset.get_default()
+        >>> try:
+        ...     asset_id.suffix = 'abc'
+        ... except NameValidationError as exc:
+        ...     print(exc.field, exc.value, exc.pattern)
+        ...
+        suffix abc sdf|usd|usda|usdc|usdz
+    """
+
+    def __init__(self, obj: DefaultName, name: str = None, field: str = None, value: str = None):
+        super().__init__()
+        self.name_type = type(obj)
+        self._obj = (obj._name, obj._separator)
+        self._name = name  # when omitted, it's the name of `obj` with `field` set to `value`
+        self._convention = obj._convention
+        self._field = (field, value) if field else None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r})"
+
+    def __reduce__(self):  # e.g. from process pools, objects the error was raised from are not kept around
+        return ValueError, (str(self),)
+
+    @property
+    def name(self) -> str:
+        """The invalid name."""
+        if self._name is None:
+            current, sep = self._obj
+            field, value = self._field
+            self._name = self.name_type(current, sep=sep).get(**{field: value})
+        return self._name
+
+    def _diagnose(self) -> tuple:
+        if self._field is None:
+            self._field = _invalid_field(self._convention, self.name)
+        return self._field
+
+    @property
+    def field(self) -> typing.Optional[str]:
+        """Name of the first field with an invalid value, or None if it can't be found."""
+        return self._diagnose()[0]
+
+    @property
+    def value(self) -> typing.Optional[str]:
+        """Invalid value of :attr:`field`."""
+        return self._diagnose()[1]
+
+    @property
+    def pattern(self) -> typing.Optional[str]:
+        """Pattern that values of :attr:`field` should match (from its token, e.g. :obj:`grill.tokens.ids.CGAsset`)."""
+        field = self.field
+        return self._convention.patterns[field].pattern if field else None
+
+    def __str__(self):
+        prefix = f"Can't set invalid name '{self.name}' on {self.name_type.__name__}(\"{self._obj[0]}\")."
+        field, value = self._diagnose()
+        if field:
+            return f"{prefix} Field '{field}' has invalid value '{value}', expected pattern: '{self.pattern}'"
+        proxy = self.name_type._prototype(self._obj[1])
+        return f"{prefix} Valid convention is: '{proxy.get()}' with pattern: '{self._convention.regex.pattern}'"
+
+
+def _invalid_field(convention: _Convention, name: str) -> tuple:
+    """Get the (field, value) of the field with an invalid value in `name`, or (None, None) if not found.
+
+    A field is blamed only when it is the single one that, relaxed to match anything, makes `name` match with a
+    value that fails its own pattern, and that value is the same however much the relaxed field takes. Structural
+    errors (e.g. an extra or a missing segment) could be explained by many fields, so no field is blamed for them.
+    """
+    pattern = convention.regex.pattern
+    found = None
+    for field, field_pattern in convention.patterns.items():
+        if _NAMED_GROUP.search(field_pattern.pattern):  # compounds are checked through their fields
+            continue
+        group = f'(?P<{field}>{field_pattern.pattern})'
+        relaxed = re.match(pattern.replace(group, f'(?P<{field}>.*?)', 1), name)
+        if relaxed is None or field_pattern.fullmatch(value := relaxed.group(field)):
+            continue
+        greedy = re.match(pattern.replace(group, f'(?P<{field}>.*)', 1), name)
+        if found or greedy.group(field) != value:  # ambiguous
+            return None, None
+        found = (field, value)
+    return found or (None, None)
+
+
+class _FieldValue(naming.base.FieldValue):
+    """Field of a :class:`grill.names.DefaultName`, validated against its own pattern when a new name fails.
+
+    Values that only match the convention by shifting other fields (e.g. containing the separator) are rejected too.
+    """
+
+    def __set__(self, obj, val):
+        value = str(val)
+        if val and value == obj._values.get(self.name):
+            return
+        if obj.SPLICE_FIELDS:
+            convention = obj._convention
+            pattern = convention.patterns.get(self.name)
+            if pattern is not None:
+                if not pattern.fullmatch(value):
+                    raise NameValidationError(obj, field=self.name, value=value)
+                if not pattern.groups and obj._splice(convention, self.name, value):  # no compounds
+                    return
+        previous = obj._name
+        try:
+            obj.name = obj.get(**{self.name: val})
+        except NameValidationError:
+            pattern = obj._convention.patterns.get(self.name)
+            if val and pattern is not None and not pattern.fullmatch(value):
+                raise NameValidationError(obj, field=self.name, value=value) from None
+            raise
+        if val and obj._values.get(self.name, value) != value:
+            obj.name = previous  # matched by shifting other fields
+            raise NameValidationError(obj, field=self.name, value=value)
+
+
 class DefaultName(naming.Name):
     """ Inherited by: :class:`grill.names.CGAsset`
 
@@ -62,17 +744,509 @@ class DefaultName(naming.Name):
 
     Subclass implementations can override the `_defaults` member to return a mapping
     appropriate to that class.
+
+    Compiled convention patterns are cached per class and separator, so creating new
+    instances does not solve the convention again. Caching is thread safe: concurrent
+    first uses of a class solve its convention once.
+
+    Default names are cached per class as well (see :attr:`CACHE_DEFAULTS`).
+    """
+    SPLICE_FIELDS = False
+    """When setting a field, replace its value on the current name instead of building and matching a new one.
+
+    New values are checked against the pattern of their field only. Can be set on classes or on single objects.
     """
-    _defaults = {}
+    VERIFY_SPLICES = True
+    """Whether names with a spliced field value are matched against the whole convention again."""
+    SEGMENT_MATCHING = False
+    """Parse names by splitting them on their separators and checking each field value on its own.
+
+    Values are the same as when matching the whole convention pattern, in linear time and rejecting invalid names
+    as soon as a field fails, with word alternations (e.g. suffixes) checked as set lookups. Conventions where a
+    field value could contain a separator keep matching the whole pattern. Can be set on classes or on single objects.
+
+    This pays off on inputs with many near misses or with field patterns prone to backtracking. Valid names of
+    simple conventions are parsed faster by the compiled pattern.
+    """
+    PARSE_CACHE: typing.Optional[ParseCache] = None
+    """Cache of the field values of parsed name strings, reused when setting the same names again.
+
+    Disabled by default. Set a :class:`grill.names.ParseCache` on a class (shared by its subclasses) to enable it.
+    Objects copy the cached values, so changing them does not change the cache. Use :meth:`parse` to also skip
+    the setup of new objects.
+
+    Example:
+        >>> UsdAsset.PARSE_CACHE = ParseCache(maxsize=10_000)
+    """
+    CACHE_DEFAULTS = True
+    """Whether :meth:`get_default` can reuse the default name solved for this class on a previous call.
+
+    Cached defaults are solved again when the convention or tokens of the class change. Disable it on classes whose
+    `_defaults` change otherwise (e.g. over time, like :class:`grill.names.DateTimeFile`).
+    """
+
+    _config_names = ('config',)
+    _match = _regs = None  # last match of the name and field offsets updated since, when splicing fields
+
+    @property
+    def _defaults(self):
+        return {}
+
+    _field_values = {}  # {field: _FieldValue subclass} to use as the descriptor of a field, instead of _FieldValue
+
+    def __init_subclass__(cls, **kwargs):
+        _declare_config(cls)
+        super().__init_subclass__(**kwargs)
+        config_names = {k for c in cls.mro() for k, v in vars(c).items() if isinstance(v, naming.NameConfig)}
+        # solving a NameConfig keeps track of its compound fields on the class, so `config` must be solved last
+        cls._config_names = (*sorted(config_names - {'config'}), 'config')
+        # naming sets its own descriptor for fields of every new class (and None for dropped fields), while fields
+        # from other configs (e.g. `version` from naming.Pipe) are inherited from the class declaring them
+        fields = {field for c in cls.mro() for field, v in vars(c).items() if isinstance(v, naming.base.FieldValue)}
+        for field in fields:
+            descriptor = next(vars(c)[field] for c in cls.mro() if field in vars(c))
+            field_value = cls._field_values.get(field, _FieldValue)
+            if isinstance(descriptor, naming.base.FieldValue) and type(descriptor) is not field_value:
+                setattr(cls, field, field_value(field))
+
+    def _init_name_core(self, name: str):
+        # _BaseName keeps its compiled pattern on a private (mangled) member, share the cached one instead
+        self._BaseName__regex = self._convention.regex
+        self.name = name
+
+    @property
+    def _convention(self) -> _Convention:
+        cls = type(self)
+        # compare declared configs: solving one each time is costly when it is not memoized (e.g. when all of its
+        # fields are compound members, like the `config` of DateTimeFile)
+        configs = tuple(getattr(cls, attr) for attr in self._config_names)
+        sep = self._separator
+        conventions = _CONVENTIONS.get(cls)
+        convention = None if conventions is None else conventions.get(sep)
+        if convention is None or convention.configs != configs:
+            with _CONVENTIONS_LOCK:
+                configs = tuple(getattr(cls, attr) for attr in self._config_names)  # may have been reloaded
+                conventions = _CONVENTIONS.get(cls)
+                if conventions is None:
+                    conventions = _CONVENTIONS[cls] = {}
+                convention = conventions.get(sep)
+                if convention is None or convention.configs != configs:
+                    convention = conventions[sep] = self._solve_convention(configs)
+        return convention
+
+    def _solve_convention(self, configs: tuple) -> _Convention:
+        # the pattern is built from the compound fields tracked (on `_uc`) while solving `config`. Those are set on
+        # the class too, so a concurrent first solve of another config may have replaced them: solve it again here
+        config = vars(type(self))['config']
+        naming.NameConfig(config.cfg, config.name).__get__(self, type(self))
+        pattern = self._pattern
+        regex = re.compile(rf'^{pattern}$')
+        patterns = {field: re.compile(group) for field, group in _group_patterns(pattern).items()}
+        fields, indices = tuple(regex.groupindex), tuple(regex.groupindex.values())
+        matcher = _segment_matcher(self, pattern, _group_patterns(pattern))
+        return _Convention(configs, regex, fields, indices, patterns, dict(zip(indices, fields)), matcher)
+
+    @property
+    def name(self) -> str:
+        """This object's solved name.
+
+        :raises NameValidationError: If an invalid string is provided when setting the attribute.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        name = rf'{name}' if name else ''
+        if name:
+            cache = None if self.SPLICE_FIELDS else self.PARSE_CACHE
+            if cache is not None:
+                key = (type(self), self._BaseName__regex, name)
+                if (values := cache.get(key)) is not None:  # validated already
+                    self._values.update(values)
+                    self._name = name
+                    return
+            if self.SEGMENT_MATCHING and not self.SPLICE_FIELDS and (matcher := self._convention.matcher):
+                matched, values = None, matcher(name)
+            else:
+                matched = self._BaseName__regex.match(name)
+                values = None if matched is None else matched.groupdict()
+            if values is None:
+                raise NameValidationError(self, name)
+            self._validate_values(values)
+            self._values.update(values)
+            if cache is not None:
+                cache.put(key, values)
+        else:
+            self._values.clear()
+            matched = None
+        self._name = name
+        if self.SPLICE_FIELDS:  # keep field offsets to splice values on
+            self._match, self._regs = matched, None
+
+    def _splice(self, convention: _Convention, field: str, value: str) -> bool:
+        """Set `field` to an already validated `value` by replacing its span on the current name.
+
+        :returns: Whether the value could be spliced. It can't when no offsets are known for `field`.
+        """
+        regs = self._regs
+        if regs is None:
+            if self._match is None:
+                return False
+            regs = self._match.regs
+        group = convention.regex.groupindex[field]
+        start, end = regs[group]
+        if start < 0:  # field not present on the current name
+            return False
+        name = self._name
+        name = name[:start] + value + name[end:]
+        if self.VERIFY_SPLICES:
+            self.name = name
+            return True
+        delta = len(value) - (end - start)
+        groups = convention.groups
+        values = {field: value}
+        new_regs = []
+        for index, (group_start, group_end) in enumerate(regs):
+            if index == group:
+                group_end += delta
+            elif group_start >= end:  # after the spliced field
+                group_start += delta
+                group_end += delta
+            elif 0 <= group_start <= start and group_end >= end:  # encloses the spliced field, e.g. a compound
+                group_end += delta
+                if index in groups:
+                    values[groups[index]] = name[group_start:group_end]
+            new_regs.append((group_start, group_end))
+        self._validate_values(dict(self._values, **values))
+        self._values.update(values)
+        self._name = name
+        self._match, self._regs = None, new_regs
+        return True
+
+    def _validate_values(self, values: typing.Dict[str, str]):
+        """Validate the `values` of a name matching the convention, beyond its pattern. Raise ValueError if invalid."""
+
+    @classmethod
+    def _prototype(cls, sep: str = None) -> DefaultName:
+        """Get an empty name of this class with `sep` separator (or the class one), shared by class level queries."""
+        # {separator argument: empty name} are kept on the class itself, so they are collected with it
+        # (a mapping weakly keyed by class would not release it: prototypes reference their class)
+        try:
+            return vars(cls)['_prototypes'][sep]
+        except KeyError:
+            pass
+        proto = cls() if sep is None else cls(sep=sep)
+        with _CONVENTIONS_LOCK:
+            prototypes = vars(cls).get('_prototypes')
+            if prototypes is None:
+                prototypes = {}
+                setattr(cls, '_prototypes', prototypes)
+            return prototypes.setdefault(sep, proto)
+
+    @classmethod
+    def parse(cls, name: str, sep: str = None) -> DefaultName:
+        """Get a new name object from the `name` string, copying the setup of an existing object of this class.
+
+        Same as creating the object, but faster when many are created. With a :attr:`PARSE_CACHE`, strings parsed
+        before are not matched again either.
+
+        :param sep: Separator of the name. Defaults to the one of this class.
+        :raises NameValidationError: If `name` is not valid.
+
+        Example:
+            >>> UsdAsset.parse('demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda')
+            UsdAsset("demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda")
+        """
+        proto = cls._prototype(sep)
+        result = cls.__new__(cls)
+        result.__dict__.update(proto.__dict__)
+        result._values = {}
+        result._items = result._values.items()
+        result._BaseName__regex = proto._convention.regex
+        result.name = name
+        return result
+
+    @classmethod
+    def is_valid(cls, name: str, sep: str = None) -> bool:
+        """Whether `name` is valid for this class, without creating a new name object or raising errors.
+
+        :param name: String to validate.
+        :param sep: Separator of the name. Defaults to the one of this class.
+
+        Example:
+            >>> UsdAsset.is_valid('demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda')
+            True
+            >>> UsdAsset.is_valid('demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.abc')
+            False
+        """
+        proto = cls._prototype(sep)
+        if not isinstance(name, str):
+            return False
+        convention = proto._convention
+        if cls.SEGMENT_MATCHING and convention.matcher:
+            values = convention.matcher(name)
+        else:
+            values = None if (matched := convention.regex.match(name)) is None else matched.groupdict()
+        if values is None:
+            return False
+        try:
+            proto._validate_values(values)
+        except ValueError:
+            return False
+        return True
+
+    @classmethod
+    def validate_fields(cls, sep: str = None, **values) -> typing.Dict[str, typing.Optional[str]]:
+        """Get the invalid `values` of this class, each one to its expected pattern (None for unknown fields).
+
+        Each value is checked against the pattern of its own field only, without building a name or raising errors.
+
+        Example:
+            >>> UsdAsset.validate_fields(area='model', suffix='abc', missing='value')
+            {'suffix': 'sdf|usd|usda|usdc|usdz', 'missing': None}
+        """
+        patterns = cls._prototype(sep)._convention.patterns
+        invalid = {}
+        for field, value in values.items():
+            pattern = patterns.get(field)
+            if pattern is None or not pattern.fullmatch(str(value)):
+                invalid[field] = None if pattern is None else pattern.pattern
+        return invalid
 
     @classmethod
     def get_default(cls, **kwargs) -> DefaultName:
-        """Get a new Name object with default values and overrides from **kwargs."""
-        name = cls()
-        defaults = dict(name._defaults, **kwargs)
-        name.name = name.get(**defaults)
+        """Get a new Name object with default values and overrides from **kwargs.
+
+        Unless :attr:`CACHE_DEFAULTS` is disabled, the default name is solved once per class and
+        new objects start from a copy of it, so only the overrides are validated.
+        """
+        if not cls.CACHE_DEFAULTS:
+            name = cls()
+            name.name = name.get(**dict(name._defaults, **kwargs))
+            return name
+        key = (cls._prototype()._convention, getattr(cls, 'DEFAULT_SUFFIX', None))
+        cached = _DEFAULT_NAMES.get(cls)
+        if cached is None or cached[0] != key:
+            default = cls()
+            default.name = default.get(**default._defaults)
+            state = {k: v for k, v in default.__dict__.items() if k not in {'_match', '_regs'}}
+            cached = _DEFAULT_NAMES[cls] = (key, state)
+        name = cls.__new__(cls)
+        name.__dict__.update(cached[1])
+        values = name._values = dict(name._values)
+        name._items = values.items()
+        if name.SPLICE_FIELDS:
+            name._match = name._BaseName__regex.match(name._name)
+        if kwargs:
+            name.name = name.get(**kwargs)
         return name
 
+    def _build_many(self, keys: typing.Sequence[str], rows: typing.Iterable[typing.Sequence[str]]) -> list:
+        """Get new names with `keys` fields set to the values of each of `rows`, and the rest from this name.
+
+        Each value is checked against the pattern of its own field only, so names are created without matching
+        the whole convention again (unless compound fields can't be solved directly from their members).
+        """
+        checks = [self._convention.patterns[key].fullmatch for key in keys]
+        # a distinct marker per key locates its value on the name, whatever the order of the fields in it
+        parts = _MARKER.split(self.get(**{key: f'\0{index}\0' for index, key in enumerate(keys)}))
+        head, order, tail = parts[0], [int(index) for index in parts[1::2]], parts[2::2]
+        compounds = self.join.keys()
+        fast = sorted(order) == list(range(len(keys))) and not compounds & set(keys) and not any(
+            compounds & set(fields) for fields in self.join.values()  # nested (or redefined) compounds
+        )
+        cls = type(self)
+        state = {k: v for k, v in self.__dict__.items() if k not in {'_match', '_regs'}}  # offsets of this name only
+        defaults = {k: v for k, v in self._values.items() if k not in compounds}
+        join_sep = self.join_sep
+        result = []
+        for row in rows:
+            for key, check, value in zip(keys, checks, row):
+                if not check(value):
+                    raise ValueError(f"Value '{value}' does not match the pattern of field '{key}' on {self!r}")
+            name = cls.__new__(cls)
+            if fast:
+                name.__dict__.update(state)
+                values = name._values = dict(defaults, **dict(zip(keys, row)))
+                for compound, fields in self.join.items():
+                    members = [values.get(field) for field in fields]
+                    values[compound] = None if None in members else join_sep.join(members)
+                name._items = values.items()
+                name._name = head + ''.join(map(operator.add, map(row.__getitem__, order), tail))
+            else:
+                name.__init__(sep=self.sep)
+                name.name = self.get(**dict(zip(keys, row)))
+            result.append(name)
+        return result
+
+    def update(self, **fields):
+        """Set multiple `fields` at once, validating the resulting name only once.
+
+        Example:
+            >>> name = UsdAsset.get_default()
+            >>> name.update(area='model', version=3)
+            >>> name
+            UsdAsset("demo-3d-abc-entity-model-main-atom-lead-base-whole.3.usd")
+        """
+        if fields:
+            self.name = self.get(**fields)
+
+    def freeze(self) -> FrozenName:
+        """Get an immutable, hashable and compact snapshot of this name."""
+        fields = self._convention.fields
+        values = self._values
+        return FrozenName(
+            type(self), self._separator, fields,
+            tuple(None if value is None else sys.intern(value) for value in map(values.get, fields)),
+        )
+
+    @classmethod
+    def thaw(cls, frozen: FrozenName) -> DefaultName:
+        """Get a new name object from a snapshot created by :meth:`grill.names.DefaultName.freeze`.
+
+        :raises TypeError: If the snapshot was not taken from an instance of this class (or a subclass).
+        """
+        if not issubclass(frozen._type, cls):
+            raise TypeError(f"Can't thaw a snapshot of {frozen._type.__name__} as {cls.__name__}")
+        name = frozen._type(sep=frozen._sep)
+        values = {field: value for field, value in zip(frozen._fields, frozen._values) if value is not None}
+        if values:
+            name.name = name.get(**values)
+        return name
+
+    @classmethod
+    def parse_many(cls, names: typing.Iterable[str], sep: str = None) -> ParsedNames:
+        """Parse `names` in bulk, without creating a Name object per string.
+
+        The cached convention pattern of this class is used to match every string. Names matching it are masked as
+        invalid too when they fail the validation of this class (e.g. dates of :class:`grill.names.DateTimeFile`).
+
+        :param names: Strings to parse.
+        :param sep: Separator of the names. Defaults to the one of this class.
+
+        Example:
+            >>> parsed = UsdAsset.parse_many(['demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda', 'bad.usd'])
+            >>> parsed.fields['area']
+            ['rnd', None]
+            >>> parsed.mask
+            [False, True]
+        """
+        proto = cls._prototype(sep)
+        convention = proto._convention
+        fields, indices = convention.fields, convention.indices
+        # only classes validating beyond the pattern pay for building a mapping per name
+        check = proto._validate_values if cls._validate_values is not DefaultName._validate_values else None
+        invalid = (None,) * len(fields)
+        match = convention.regex.match
+        matcher = convention.matcher if cls.SEGMENT_MATCHING else None
+        rows = []
+        mask = []
+        for name in names:
+            if matcher:
+                values = matcher(name)
+                row = None if values is None else tuple(values.values())
+            else:
+                matched = match(name)
+                row = None if matched is None else (
+                    matched.group(*indices) if len(indices) > 1 else (matched.group(*indices),)
+                )
+            if row is not None and check:
+                try:
+                    check(dict(zip(fields, row)))
+                except ValueError:
+                    row = None
+            if row is None:
+                rows.append(invalid)
+                mask.append(True)
+            else:
+                rows.append(row)
+                mask.append(False)
+        columns = zip(*rows) if rows else itertools.repeat((), len(fields))
+        return ParsedNames(dict(zip(fields, map(list, columns))), mask)
+
+    @classmethod
+    def to_columns(cls, names: typing.Iterable[str], sep: str = None) -> NameColumns:
+        """Export `names` in bulk to dictionary encoded columns, without creating a Name object per string.
+
+        Columns are named after the fields of the convention (e.g. the tokens of :data:`grill.tokens.ids.CGAsset`).
+        Values are stored once per field, and every name as a single integer code per field.
+
+        :param names: Strings to export. Invalid ones are exported with missing values, see ``mask``.
+        :param sep: Separator of the names. Defaults to the one of this class.
+        """
+        patterns = cls._prototype(sep)._convention.patterns
+        parsed = cls.parse_many(names, sep=sep)
+        codes, categories = {}, {}
+        for field, values in parsed.fields.items():
+            if patterns[field].groupindex:  # compound fields are solved from their members
+                continue
+            lookup = {value: code for code, value in enumerate(dict.fromkeys(values))}
+            if None in lookup:
+                del lookup[None]
+                lookup = {value: code for code, value in enumerate(lookup)}
+                lookup[None] = -1
+            codes[field] = array.array('i', map(lookup.__getitem__, values))
+            categories[field] = tuple(value for value in lookup if value is not None)
+        return NameColumns(codes, categories, array.array('b', parsed.mask))
+
+    @classmethod
+    def from_columns(
+            cls,
+            columns: NameColumns,
+            sep: str = None,
+            validate: bool = False,
+    ) -> typing.List[typing.Optional[str]]:
+        """Rebuild name strings in bulk from `columns` exported via :meth:`grill.names.DefaultName.to_columns`.
+
+        A name template is solved once per combination of missing (optional) fields, and filled with the values of
+        every name. Names with no values (invalid when exported) are rebuilt as ``None``.
+
+        :param validate: Match every name against the convention, raising ValueError on invalid ones.
+
+        Example:
+            >>> columns = UsdAsset.to_columns(['demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda', 'bad.usd'])
+            >>> UsdAsset.from_columns(columns)
+            ['demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda', None]
+        """
+        fields = tuple(columns.codes)
+        values = [
+            list(map((*columns.categories[field], None).__getitem__, columns.codes[field])) for field in fields
+        ]
+        return cls._join_rows(fields, zip(*values), sep, validate)
+
+    @classmethod
+    def _join_rows(
+            cls,
+            fields: typing.Sequence[str],
+            rows: typing.Iterable[typing.Sequence[typing.Optional[str]]],
+            sep: typing.Optional[str],
+            validate: bool,
+    ) -> typing.List[typing.Optional[str]]:
+        """Get the name string with the `fields` values of each of `rows` (``None`` when all values are missing).
+
+        A name template is solved once per combination of missing (``None``) values, and filled with every row.
+        """
+        proto = cls._prototype(sep)  # empty: only the given fields are solved
+        templates = {}
+        match = proto._convention.regex.match if validate else None
+        result = []
+        for row in rows:
+            present = tuple(index for index, value in enumerate(row) if value is not None)
+            try:
+                head, order, tail = templates[present]
+            except KeyError:
+                template = proto.get(**{fields[i]: f'\0{i}\0' for i in present}) if present else ''
+                parts = _MARKER.split(template)
+                head, order, tail = templates[present] = (parts[0], [int(i) for i in parts[1::2]], parts[2::2])
+            if not present:
+                result.append(None)
+                continue
+            name = head + ''.join(map(operator.add, map(row.__getitem__, order), tail))
+            if validate and not match(name):
+                raise ValueError(f"Invalid {cls.__name__} values {dict(zip(fields, row))} for name: '{name}'")
+            result.append(name)
+        return result
+
 
 class DefaultFile(DefaultName, naming.File):
     """ Inherited by: :class:`grill.names.DateTimeFile`
@@ -92,6 +1266,26 @@ class DefaultFile(DefaultName, naming.File):
         return result
 
 
+_DATETIME_FIELDS = ('year', 'month', 'day', 'hour', 'minute', 'second', 'microsecond')
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class _DateTimeField(_FieldValue):
+    """Field of a :class:`grill.names.DateTimeFile`, validated numerically before a new name is built."""
+
+    def __set__(self, obj, val):
+        values = obj._values
+        if obj._name and self.name in values:
+            try:
+                number = int(val)
+            except (TypeError, ValueError):  # not a number, base class reports the field pattern
+                pass
+            else:  # e.g. ValueError: month must be in 1..12
+                datetime(*(number if f == self.name else int(values[f]) for f in _DATETIME_FIELDS))
+        super().__set__(obj, val)
+
+
 class DateTimeFile(DefaultFile):
     """Time based file names respecting iso standard.
 
@@ -143,13 +1337,14 @@ class DateTimeFile(DefaultFile):
         time=('hour', 'minute', 'second', 'microsecond'),
     )
     join_sep = '-'
+    CACHE_DEFAULTS = False  # defaults to the current time
+    _field_values = dict.fromkeys(_DATETIME_FIELDS, _DateTimeField)
 
     @property
     def _defaults(self):
         result = super()._defaults
-        time_field = {'year', 'month', 'day', 'hour', 'minute', 'second', 'microsecond'}
         now = datetime.now()
-        result.update({f: getattr(now, f) for f in time_field})
+        result.update({f: getattr(now, f) for f in _DATETIME_FIELDS})
         return result
 
     def get_pattern_list(self) -> list[str]:
@@ -159,21 +1354,8 @@ class DateTimeFile(DefaultFile):
         """
         return ["date", "time"] + super().get_pattern_list()
 
-    @property
-    def name(self) -> str:
-        return super().name
-
-    @name.setter
-    def name(self, name: str):
-        prev_name = self._name
-        super(DateTimeFile, self.__class__).name.fset(self, name)
-        if name:
-            try:  # validate via datetime conversion
-                self.datetime
-            except ValueError:
-                if prev_name:  # if we had a previous valid name, revert to it
-                    self.name = prev_name
-                raise
+    def _validate_values(self, values: typing.Dict[str, str]):
+        datetime(*map(int, map(values.__getitem__, _DATETIME_FIELDS)))  # e.g. ValueError: month must be in 1..12
 
     @property
     def datetime(self) -> datetime:
@@ -185,10 +1367,91 @@ class DateTimeFile(DefaultFile):
         """
         if not self.name:
             raise AttributeError("Can not retrieve datetime from an empty name")
-        date = f"{int(self.year):04d}-{int(self.month):02d}-{int(self.day):02d}"
-        time = (f"{int(self.hour):02d}:{int(self.minute):02d}:{int(self.second):02d}."
-                f"{int(self.microsecond):06d}")
-        return datetime.fromisoformat(f'{date}T{time}')
+        return datetime(*map(int, map(self._values.__getitem__, _DATETIME_FIELDS)))
+
+    @classmethod
+    def timestamps(cls, names: typing.Iterable[str], sep: str = None, datetime64: bool = False) -> list:
+        """Get the epoch timestamps (in microseconds) of the datetimes of `names`, without creating name objects.
+
+        Name datetimes are naive, so they are considered to be UTC.
+
+        :param names: Strings to convert.
+        :param sep: Separator of the names. Defaults to the one of this class.
+        :param datetime64: Return a :class:`numpy.ndarray` of ``datetime64[us]`` values. Requires ``numpy``.
+        :raises ValueError: If any of the names is invalid.
+
+        Example:
+            >>> DateTimeFile.timestamps(['1970-1-1 0-0-1-0.txt', '1999-10-28 22-29-31-926548.txt'])
+            [1000000, 941149771926548]
+        """
+        convention = cls._prototype(sep)._convention
+        match = convention.regex.match
+        indices = [convention.indices[convention.fields.index(field)] for field in _DATETIME_FIELDS]
+        result = []
+        for name in names:
+            matched = match(name)
+            if matched is None:
+                raise ValueError(f"Can't get timestamp of invalid name '{name}'. Valid pattern is: '{convention.regex.pattern}'")
+            result.append((datetime(*map(int, matched.group(*indices))) - _EPOCH) // _MICROSECOND)
+        if datetime64:
+            import numpy
+            return numpy.array(result, dtype='datetime64[us]')
+        return result
+
+    @classmethod
+    def from_timestamps(cls, timestamps: typing.Iterable, sep: str = None, **values) -> typing.List[DateTimeFile]:
+        """Get new names from epoch `timestamps`, the inverse of :meth:`DateTimeFile.timestamps`.
+
+        Other field values are validated once for all names, and datetime fields are never matched against the
+        whole convention again.
+
+        :param timestamps: Integers in microseconds since epoch (UTC), or a :class:`numpy.ndarray` of ``datetime64``.
+        :param sep: Separator of the names. Defaults to the one of this class.
+        :param values: Variable keyword arguments with the keys referring to the name's
+            fields which will use the given values.
+
+        Example:
+            >>> DateTimeFile.from_timestamps([1000000, 941149771926548], suffix='txt')
+            [DateTimeFile("1970-1-1 0-0-1-0.txt"), DateTimeFile("1999-10-28 22-29-31-926548.txt")]
+        """
+        if hasattr(timestamps, 'astype'):  # numpy arrays
+            timestamps = timestamps.astype('datetime64[us]').astype('int64').tolist()
+        proto = cls._prototype(sep)
+        base = cls.parse(proto.get(**dict(proto._defaults, **values)), sep=sep)
+        rows = (
+            [str(getattr(moment, field)) for field in _DATETIME_FIELDS]
+            for moment in (_EPOCH + timedelta(microseconds=timestamp) for timestamp in timestamps)
+        )
+        return base._build_many(_DATETIME_FIELDS, rows)
+
+    @staticmethod
+    def time_slice(timestamps: typing.Sequence, start=None, stop=None) -> slice:
+        """Get the slice of the sorted `timestamps` that are in the ``[start, stop)`` range, via binary search.
+
+        :param timestamps: Sorted result of :meth:`DateTimeFile.timestamps`.
+        :param start: Inclusive lower bound as a :class:`datetime.datetime` or a timestamp. Unbounded when omitted.
+        :param stop: Exclusive upper bound as a :class:`datetime.datetime` or a timestamp. Unbounded when omitted.
+
+        Example:
+            >>> names = ['1999-10-28 22-29-31-926548.txt', '2000-1-1 0-0-0-0.txt', '2001-1-1 0-0-0-0.txt']
+            >>> timestamps = DateTimeFile.timestamps(names)
+            >>> names[DateTimeFile.time_slice(timestamps, datetime(1999, 12, 31), datetime(2001, 1, 1))]
+            ['2000-1-1 0-0-0-0.txt']
+        """
+        def bound(value, default):
+            if value is None:
+                return default
+            if isinstance(value, datetime):
+                if value.tzinfo is not None:
+                    value = value.astimezone(timezone.utc).replace(tzinfo=None)
+                value = (value - _EPOCH) // _MICROSECOND
+            if hasattr(timestamps, 'searchsorted'):  # numpy arrays
+                if timestamps.dtype.kind == 'M' and not isinstance(value, timestamps.dtype.type):
+                    value = timestamps.dtype.type(int(value), 'us')
+                return int(timestamps.searchsorted(value))
+            return bisect.bisect_left(timestamps, value)
+
+        return slice(bound(start, 0), bound(stop, len(timestamps)))
 
 
 class CGAsset(DefaultName):
@@ -198,8 +1461,9 @@ class CGAsset(DefaultName):
     through their life cycles (e.g. a character, a film, a videogame).
 
     """
-    config = {token.name: token.value.pattern for token in ids.CGAsset}
-    __doc__ += '\n' + _table_from_id(ids.CGAsset) + '\n'
+    _token_ids = 'CGAsset'
+    config = _config_from_tokens(ids.CGAsset)
+    __doc__ = _TokensDoc(__doc__, 'CGAsset')
 
     def __init__(self, *args, sep='-', **kwargs):
         super().__init__(*args, sep=sep, **kwargs)
@@ -210,6 +1474,164 @@ class CGAsset(DefaultName):
         result.update({token.name: token.value.default for token in ids.CGAsset})
         return result
 
+    @classmethod
+    def _short_layout(cls) -> _ShortLayout:
+        tokens = getattr(ids, cls._token_ids)
+        key = (tokens, cls._prototype()._convention, getattr(cls, 'DEFAULT_SUFFIX', None))
+        cached = _SHORT_LAYOUTS.get(cls)
+        if cached is None or cached[0] != key:
+            default = cls.get_default()
+            members = tokens.__members__
+            # compound fields are solved from their members
+            fields = tuple(f for f, pattern in default._convention.patterns.items() if not pattern.groupindex)
+            keys = tuple(members[field].value.short_name if field in members else field for field in fields)
+            if len(set(keys)) != len(keys):
+                raise ValueError(f"Short names of {cls.__name__} fields are not unique: {dict(zip(fields, keys))}")
+            defaults = tuple(map(default._values.get, fields))
+            coded = tuple(field not in {'version', 'index'} for field in fields)  # already compact numbers
+            cached = _SHORT_LAYOUTS[cls] = (key, _ShortLayout(fields, keys, defaults, coded))
+        return cached[1]
+
+    @staticmethod
+    def _short_encoders(layout: _ShortLayout, codes: typing.Optional[typing.Dict[str, typing.List[str]]]) -> list:
+        """Get a function per field of `layout`, returning the encoded ``key=value`` of a value (empty if omitted)."""
+        def encoder(key, default, coded):
+            table = codes.get(key, []) if codes is not None and coded else None
+            lookup = None if table is None else {value: code for code, value in enumerate(table)}
+
+            def encode(value):
+                if value == default:
+                    return ''
+                if value is None:
+                    return f'{key}='  # missing, while the default is not
+                if lookup is not None:
+                    code = lookup.get(value)
+                    if code is None:
+                        code = lookup[value] = len(table)
+                        codes.setdefault(key, table).append(value)
+                    return f'{key}={code}'
+                if ',' in value or '=' in value:
+                    raise ValueError(f"Can not encode value '{value}' of '{key}' on a short name")
+                return f'{key}={value}'
+            return encode
+        return list(map(encoder, layout.keys, layout.defaults, layout.coded))
+
+    @staticmethod
+    def _short_values(
+            layout: _ShortLayout, codes: typing.Optional[typing.Mapping[str, typing.Sequence[str]]], encoded: str,
+    ) -> tuple:
+        """Get the value of each field of `layout` from the `encoded` short name."""
+        values = list(layout.defaults)
+        if not encoded:
+            return tuple(values)
+        positions = {key: index for index, key in enumerate(layout.keys)}
+        for pair in encoded.split(','):
+            key, __, value = pair.partition('=')
+            try:
+                index = positions[key]
+                if not value:
+                    value = None
+                elif codes is not None and layout.coded[index]:
+                    if (code := int(value)) < 0:  # negative indices would wrap around the codes
+                        raise IndexError(code)
+                    value = codes[key][code]
+            except (KeyError, IndexError, ValueError):
+                raise ValueError(f"Invalid short name '{encoded}', can not decode: '{pair}'") from None
+            values[index] = value
+        return tuple(values)
+
+    def to_short(self, codes: typing.Optional[typing.Dict[str, typing.List[str]]] = None) -> str:
+        """Get a compact ``key=value`` form of this name, keyed by the `short_name` of its tokens.
+
+        Fields with their default value are omitted (so the default name is an empty string), and the rest are
+        keyed by the `short_name` of their token (e.g. :data:`grill.tokens.ids.CGAsset`), or by the field itself
+        when there is no token for it (e.g. ``version``). Short names are decoded with the defaults at the time,
+        so keep token defaults unchanged while short names are stored.
+
+        :param codes: Dictionary of ``{key: [value, ...]}`` to encode values (except ``version`` and ``index``) as
+            their position on it. Values not found on it are appended, so share it to decode the short names.
+
+        Example:
+            >>> name = UsdAsset.get_default(area='model', version=3)
+            >>> name.to_short()
+            'a=model,version=3'
+            >>> codes = {}
+            >>> name.to_short(codes), codes
+            ('a=0,version=3', {'a': ['model']})
+        """
+        layout = self._short_layout()
+        values = map(self._values.get, layout.fields)
+        return ','.join(filter(None, map(_call, self._short_encoders(layout, codes), values)))
+
+    @classmethod
+    def from_short(
+            cls,
+            encoded: str,
+            codes: typing.Optional[typing.Mapping[str, typing.Sequence[str]]] = None,
+            sep: str = None,
+    ) -> CGAsset:
+        """Get a new name object from a short name of :meth:`to_short`.
+
+        :param codes: Dictionary used to encode the short name, if any.
+        :param sep: Separator of the name. Defaults to the one of this class.
+        :raises ValueError: If `encoded` can not be decoded, or the decoded name is not valid.
+
+        Example:
+            >>> UsdAsset.from_short('a=model,version=3')
+            UsdAsset("demo-3d-abc-entity-model-main-atom-lead-base-whole.3.usd")
+        """
+        layout = cls._short_layout()
+        name, = cls._join_rows(layout.fields, [cls._short_values(layout, codes, encoded)], sep, False)
+        if name is None:
+            raise ValueError(f"Short name '{encoded}' has no values for {cls.__name__}")
+        return cls.parse(name, sep=sep)
+
+    @classmethod
+    def to_short_many(
+            cls,
+            names: typing.Iterable[str],
+            codes: typing.Optional[typing.Dict[str, typing.List[str]]] = None,
+            sep: str = None,
+    ) -> typing.List[typing.Optional[str]]:
+        """Get the short names of :meth:`to_short` for `names` in bulk, without creating a Name object per string.
+
+        :param names: Strings to encode. Invalid ones are encoded as ``None``.
+        :param sep: Separator of the names. Defaults to the one of this class.
+        """
+        layout = cls._short_layout()
+        parsed = cls.parse_many(names, sep=sep)
+        encoders = cls._short_encoders(layout, codes)
+        columns = zip(*map(parsed.fields.__getitem__, layout.fields))
+        return [
+            None if invalid else ','.join(filter(None, map(_call, encoders, row)))
+            for invalid, row in zip(parsed.mask, columns)
+        ]
+
+    @classmethod
+    def from_short_many(
+            cls,
+            encoded: typing.Iterable[str],
+            codes: typing.Optional[typing.Mapping[str, typing.Sequence[str]]] = None,
+            sep: str = None,
+            validate: bool = False,
+    ) -> typing.List[str]:
+        """Get the name strings of short names of :meth:`to_short` in bulk, without creating a Name object per string.
+
+        :param validate: Match every name against the convention, raising ValueError on invalid ones.
+        :raises ValueError: If any of `encoded` can not be decoded.
+
+        Example:
+            >>> codes = {}
+            >>> encoded = UsdAsset.to_short_many(['demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda'], codes)
+            >>> encoded
+            ['suffix=0']
+            >>> UsdAsset.from_short_many(encoded, codes)
+            ['demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda']
+        """
+        layout = cls._short_layout()
+        rows = (cls._short_values(layout, codes, each) for each in encoded)
+        return cls._join_rows(layout.fields, rows, sep, validate)
+
 
 class CGAssetFile(CGAsset, DefaultFile, naming.PipeFile):
     """Inherited by: :class:`grill.names.UsdAsset`
@@ -236,6 +1658,170 @@ class CGAssetFile(CGAsset, DefaultFile, naming.PipeFile):
         pattern.append('version')
         return pattern
 
+    @classmethod
+    def paths_for(
+            cls,
+            rows: typing.Union[typing.Iterable[typing.Mapping], typing.Mapping[str, typing.Sequence]],
+            pure: bool = False,
+            validate: bool = False,
+            sep: str = None,
+    ) -> list:
+        """Get the `path` of many names at once, without creating a Name object per entry.
+
+        Names are built from templates solved once per combination of missing (optional) fields, the same way as
+        :meth:`grill.names.DefaultName.from_columns`. Missing fields use the values of `get_default`. Compound fields
+        (e.g. ``pipe``, or the ones created via ``join``) are always solved from their members, so given values for
+        them are ignored. Entries with a ``None`` value for a required field (e.g. names masked as invalid by
+        :meth:`grill.names.DefaultName.parse_many`) get a ``None`` path.
+
+        :param rows: Field values for each path, as an iterable of mappings or as a mapping of
+            ``{field: [value, ...]}`` columns (e.g. the fields of :meth:`grill.names.DefaultName.parse_many`).
+        :param pure: Return :class:`pathlib.PurePath` objects instead of strings.
+        :param validate: Match every file name against the convention, raising ValueError on invalid ones.
+        :param sep: Separator of the names. Defaults to the one of this class.
+
+        Example:
+            >>> CGAssetFile.paths_for([dict(area='model', version=3), dict(area='rig', suffix='abc')])
+            ['demo/3d/abc/entity/model/main/atom/lead/base/whole/3/demo-3d-abc-entity-model-main-atom-lead-base-whole.3.ext',
+             'demo/3d/abc/entity/rig/main/atom/lead/base/whole/1/demo-3d-abc-entity-rig-main-atom-lead-base-whole.1.abc']
+        """
+        proto = cls._prototype(sep)
+        # compound fields are solved from their members
+        fields = tuple(field for field, pattern in proto._convention.patterns.items() if not pattern.groupindex)
+        positions = {field: index for index, field in enumerate(fields)}
+        defaults = cls.get_default()._values
+        defaults = tuple(None if (value := defaults.get(field)) is None else str(value) for field in fields)
+        required = [index for index, value in enumerate(defaults) if value is not None]  # optional ones are None
+
+        def directory(field):  # a field of the path, or a compound of its members
+            if field in positions:
+                return operator.itemgetter(positions[field])
+            members = [directory(member) for member in proto.join[field]]
+            return lambda row: proto.join_sep.join(member(row) for member in members)
+
+        directories = [directory(field) for field in proto.get_path_pattern_list()]
+        if isinstance(rows, collections.abc.Mapping):
+            columns = rows
+            rows = (dict(zip(columns, values)) for values in zip(*columns.values()))
+        values = []
+        for row in rows:
+            row_values = list(defaults)
+            for field, value in row.items():
+                if field in positions:
+                    row_values[positions[field]] = None if value is None else str(value)
+            values.append(None if any(row_values[index] is None for index in required) else row_values)
+        names = iter(cls._join_rows(fields, filter(None, values), sep, validate))
+        result = []
+        for row_values in values:
+            if row_values is None:
+                result.append(None)
+                continue
+            path = os.sep.join((*(solve(row_values) for solve in directories), next(names)))
+            result.append(pathlib.PurePath(path) if pure else path)
+        return result
+
+    @classmethod
+    def scan(
+            cls,
+            root: typing.Union[str, os.PathLike],
+            sep: str = None,
+            max_workers: int = None,
+    ) -> typing.Iterator[CGAssetFile]:
+        """Lazily yield names of files found under `root` at their expected `path`.
+
+        Directories are listed with :func:`os.scandir`, descending only into the ones whose name is a valid value for
+        the field at their depth (from `get_path_pattern_list`). Files are yielded when their name is valid and its
+        fields match the directories they are in.
+
+        :param root: Directory to scan.
+        :param sep: Separator of the names. Defaults to the one of this class.
+        :param max_workers: When provided, list directories concurrently on a thread pool of this size
+            (useful on network filesystems). Names are then yielded in no particular order.
+
+        Example:
+            >>> for name in UsdAsset.scan('/mnt/assets'):
+            ...     print(name.path)
+            ...
+            demo/3d/abc/entity/rnd/main/atom/lead/base/whole/1/demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda
+        """
+        proto = cls._prototype(sep)
+        return (cls(name, sep=proto.sep) for name in _scan_names(proto, os.fspath(root), max_workers))
+
+    @classmethod
+    def latest(
+            cls,
+            names: typing.Union[typing.Iterable[str], str, os.PathLike],
+            sep: str = None,
+    ) -> typing.List[str]:
+        """Get the name with the highest `version` of every series in `names`.
+
+        A series is made of the names equal in all fields but `version`. Names are grouped in a single pass
+        over their strings, without creating Name objects. Invalid names are ignored.
+
+        :param names: Name strings, or a directory to :meth:`scan` them from.
+        :param sep: Separator of the names. Defaults to the one of this class.
+
+        Example:
+            >>> CGAssetFile.latest([
+            ...     'demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.ext',
+            ...     'demo-3d-abc-entity-rnd-main-atom-lead-base-whole.3.ext',
+            ...     'demo-3d-abc-entity-rnd-main-atom-lead-base-whole.2.abc',
+            ... ])
+            ['demo-3d-abc-entity-rnd-main-atom-lead-base-whole.3.ext', 'demo-3d-abc-entity-rnd-main-atom-lead-base-whole.2.abc']
+        """
+        return [name for __, name, __ in _version_series(cls._prototype(sep), names).values()]
+
+    @classmethod
+    def next_version(
+            cls,
+            names: typing.Union[typing.Iterable[str], str, os.PathLike],
+            sep: str = None,
+    ) -> typing.List[str]:
+        """Get the name of the version after the :meth:`latest` one of every series in `names`.
+
+        The width of zero padded versions is kept (e.g. ``009`` is followed by ``010``).
+
+        Example:
+            >>> CGAssetFile.next_version([
+            ...     'demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.ext',
+            ...     'demo-3d-abc-entity-rnd-main-atom-lead-base-whole.3.ext',
+            ... ])
+            ['demo-3d-abc-entity-rnd-main-atom-lead-base-whole.4.ext']
+        """
+        proto = cls._prototype(sep)
+        version = proto._convention.regex.groupindex['version']
+        match = proto._convention.regex.match
+        result = []
+        for latest, name, __ in _version_series(proto, names).values():
+            start, end = match(name).span(version)
+            result.append(f'{name[:start]}{latest + 1:0{end - start}d}{name[end:]}')  # keeps zero padding
+        return result
+
+    @classmethod
+    def missing_versions(
+            cls,
+            names: typing.Union[typing.Iterable[str], str, os.PathLike],
+            sep: str = None,
+    ) -> typing.Dict[str, typing.List[int]]:
+        """Get the versions missing in every series of `names`, between its lowest and highest ones.
+
+        :returns: Missing versions (if any), keyed by the :meth:`latest` name of their series.
+
+        Example:
+            >>> CGAssetFile.missing_versions([
+            ...     'demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.ext',
+            ...     'demo-3d-abc-entity-rnd-main-atom-lead-base-whole.4.ext',
+            ...     'demo-3d-abc-entity-rnd-main-atom-lead-base-whole.2.ext',
+            ... ])
+            {'demo-3d-abc-entity-rnd-main-atom-lead-base-whole.4.ext': [3]}
+        """
+        result = {}
+        for latest, name, versions in _version_series(cls._prototype(sep), names, track=True).values():
+            if len(versions) <= latest - min(versions):
+                result[name] = sorted(set(range(min(versions), latest)).difference(versions))
+        return result
+
+
 
 class UsdAsset(CGAssetFile):
     """Specialized :class:`grill.names.CGAssetFile` name object for USD asset resources.
@@ -258,7 +1844,7 @@ class UsdAsset(CGAssetFile):
         >>> asset_id.suffix = 'abc'
         Traceback (most recent call last):
         ...
-        ValueError: Can't set invalid name 'demo-3d-abc-entity-rnd-main-atom-lead-base-whole.42.abc' on UsdAsset("demo-3d-abc-entity-rnd-main-atom-lead-base-whole.42.usdc"). Valid convention is: '{code}-{media}-{kingdom}-{cluster}-{area}-{stream}-{item}-{step}-{variant}-{part}.{pipe}.{suffix}' with pattern: '^(?P<code>...(?P<suffix>sdf|usd|usda|usdc|usdz))$'
+        grill.names.NameValidationError: Can't set invalid name 'demo-3d-abc-entity-rnd-main-atom-lead-base-whole.42.abc' on UsdAsset("demo-3d-abc-entity-rnd-main-atom-lead-base-whole.42.usdc"). Field 'suffix' has invalid value 'abc', expected pattern: 'sdf|usd|usda|usdc|usdz'
 
     .. seealso::
         :class:`grill.names.CGAsset` for a description of available fields, :class:`naming.Name` for an overview of the core API.
@@ -267,7 +1853,7 @@ class UsdAsset(CGAssetFile):
     DEFAULT_SUFFIX = 'usd'
     file_config = naming.NameConfig(
         # NOTE: limit to only extensions starting with USD (some environments register other extensions untested by the grill)
-        {'suffix': "|".join(_USD_SUFFIXES)}
+        _USDSuffixConfig()
     )
 
     @classmethod
@@ -284,17 +1870,609 @@ class UsdAsset(CGAssetFile):
             UsdAsset("4209091047-34604-19646-169-123-test-4209091047-34604-19646-169.1.usda")
 
         """
-        keys = cls.get_default().get_pattern_list()
-        anon = itertools.cycle(uuid.uuid4().fields)
-        return cls.get_default(**collections.ChainMap(values, dict(zip(keys, anon))))
+        return cls.anonymous_batch(1, **values)[0]
+
+    @classmethod
+    def anonymous_batch(cls, n: int, **values) -> typing.List[UsdAsset]:
+        """Get `n` anonymous :class:`UsdAsset` names with optional field overrides.
+
+        Overrides are validated once for the whole batch. Anonymous values are the digits of random UUID (version 4)
+        fields, as in :meth:`UsdAsset.get_anonymous`, and are checked against the pattern of their own field only,
+        so names are created without matching the whole convention again. Safe to call from multiple threads.
+
+        :param n: Amount of names to get.
+        :param values: Variable keyword arguments with the keys referring to the name's
+            fields which will use the given values.
+
+        Example:
+            >>> UsdAsset.anonymous_batch(2, stream='test', suffix='usdc')
+            [UsdAsset("2436412463-62767-17939-191-91-test-2436412463-62767-17939-191.1.usdc"), UsdAsset("1398046611-1398-18335-138-232-test-1398046611-1398-18335-138.1.usdc")]
+        """
+        proto = cls.get_default(**values)
+        # UUID fields are cycled through all fields, overridden ones included
+        positions = {key: position % 6 for position, key in enumerate(proto.get_pattern_list()) if key not in values}
+        keys = list(positions)
+        rows = ([str(fields[position]) for position in positions.values()] for fields in _uuid4_fields(n))
+        return proto._build_many(keys, rows)
 
 
 class LifeTR(naming.Name):
     """Taxonomic Rank used for biological classification.
 
     """
-    config = {token.name: token.value.pattern for token in ids.LifeTR}
-    __doc__ += '\n' + _table_from_id(ids.LifeTR) + '\n'
+    _token_ids = 'LifeTR'
+    config = _config_from_tokens(ids.LifeTR)
+    __doc__ = _TokensDoc(__doc__, 'LifeTR')
+
+    def __init_subclass__(cls, **kwargs):
+        _declare_config(cls)
+        super().__init_subclass__(**kwargs)
 
     def __init__(self, *args, sep=':', **kwargs):
         super().__init__(*args, sep=sep, **kwargs)
+
+
+def _uuid4_fields(count: int) -> typing.Iterator[tuple]:
+    """Yield the :attr:`uuid.UUID.fields` of `count` random UUIDs (version 4), without creating the UUID objects."""
+    import struct  # only needed here, keep it out of the module import time
+    data = os.urandom(16 * count)  # same source of randomness as uuid.uuid4
+    unpack = struct.Struct('>IHHBB').unpack_from
+    for offset in range(0, 16 * count, 16):
+        time_low, time_mid, time_hi, clock_seq_hi, clock_seq_low = unpack(data, offset)
+        yield (
+            time_low, time_mid, time_hi & 0x0FFF | 0x4000, clock_seq_hi & 0x3F | 0x80, clock_seq_low,
+            int.from_bytes(data[offset + 10:offset + 16], 'big'),
+        )
+
+
+def _scan_names(proto: CGAssetFile, root: str, max_workers: typing.Optional[int]) -> typing.Iterator[str]:
+    """Yield names of valid files under `root` at the `path` of `proto` name class. See :meth:`CGAssetFile.scan`."""
+    convention = proto._convention
+    path_fields = proto.get_path_pattern_list()
+    levels = [convention.patterns[field].fullmatch for field in path_fields]
+    depth = len(levels)
+    match = convention.regex.match
+    path_indices = [convention.indices[convention.fields.index(field)] for field in path_fields]
+
+    def names_in(entries, segments):
+        for entry_name, is_dir in entries:
+            if not is_dir and (matched := match(entry_name)) and matched.group(*path_indices) == segments:
+                yield entry_name
+
+    if max_workers is None:
+        stack = [(root, ())]
+        while stack:
+            directory, segments = stack.pop()
+            entries = _list_directory(directory)
+            if len(segments) == depth:
+                yield from names_in(entries, segments)
+                continue
+            valid = levels[len(segments)]
+            stack.extend(
+                (os.path.join(directory, entry_name), (*segments, entry_name))
+                for entry_name, is_dir in reversed(entries) if is_dir and valid(entry_name)
+            )
+        return
+
+    from concurrent import futures
+    executor = futures.ThreadPoolExecutor(max_workers)
+    try:
+        pending = {executor.submit(_list_directory, root): (root, ())}
+        while pending:
+            done, __ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                directory, segments = pending.pop(future)
+                entries = future.result()
+                if len(segments) == depth:
+                    yield from names_in(entries, segments)
+                    continue
+                valid = levels[len(segments)]
+                for entry_name, is_dir in entries:
+                    if is_dir and valid(entry_name):
+                        child = os.path.join(directory, entry_name)
+                        pending[executor.submit(_list_directory, child)] = (child, (*segments, entry_name))
+    finally:  # e.g. the consumer stopped early, queued listings are not needed anymore
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _version_series(proto: CGAssetFile, names, track: bool = False) -> typing.Dict[tuple, list]:
+    """Group valid `names` (or the ones scanned under a directory) of `proto` class by all fields but `version`.
+
+    :returns: The [highest version, its name, all versions (only when tracked)] of each group, by first appearance.
+    """
+    if isinstance(names, (str, os.PathLike)):
+        names = _scan_names(proto, os.fspath(names), None)
+    match = proto._convention.regex.match
+    version = proto._convention.regex.groupindex['version']
+    series = {}
+    for name in names:
+        if (matched := match(name)) is None:
+            continue
+        start, end = matched.span(version)
+        value = int(name[start:end])
+        key = (name[:start], name[end:])  # every other field, at the same positions
+        try:
+            group = series[key]
+        except KeyError:
+            series[key] = [value, name, {value} if track else None]
+            continue
+        if value > group[0]:
+            group[0], group[1] = value, name
+        if track:
+            group[2].add(value)
+    return series
+
+
+def _list_directory(path: str) -> typing.List[typing.Tuple[str, bool]]:
+    """Get the (name, is directory) entries of `path`, or none if it can't be listed (like :func:`os.walk`)."""
+    try:
+        with os.scandir(path) as entries:
+            return [(entry.name, entry.is_dir()) for entry in entries]
+    except OSError:
+        return []
+
+
+class NameIndex:
+    """Inverted indexes per field over a collection of name strings of a single class.
+
+    Names are parsed once when added (without creating Name objects) and each of their field values is indexed,
+    so queries only visit the names that match.
+
+    Example:
+        >>> index = NameIndex(UsdAsset, os.listdir(asset_directory))
+        >>> index.query(code='demo', area='model')
+        {'demo-3d-abc-entity-model-main-atom-lead-base-whole.1.usda', 'demo-3d-abc-entity-model-main-atom-lead-base-whole.2.usda'}
+        >>> index.query_prefix(area='mo')
+        {'demo-3d-abc-entity-model-main-atom-lead-base-whole.1.usda', 'demo-3d-abc-entity-model-main-atom-lead-base-whole.2.usda'}
+        >>> index.latest(code='demo', area='model')
+        ['demo-3d-abc-entity-model-main-atom-lead-base-whole.2.usda']
+
+    .. note::
+        Queries can run concurrently, but adding or removing names must not happen while other threads use the index.
+    """
+
+    def __init__(self, name_type: typing.Type[DefaultName], names: typing.Iterable[str] = (), sep: str = None):
+        convention = name_type._prototype(sep)._convention
+        self.name_type = name_type
+        self._match = convention.regex.match
+        self._fields = convention.fields
+        self._indices = convention.indices
+        self._postings = {field: {} for field in self._fields}  # {field: {value: {name, ...}}}
+        self._sorted = {field: [] for field in self._fields}  # {field: [value, ...]} for prefix queries
+        self._names = {}  # {name: (value, ...)}
+        # names are grouped by every field except their version, when present
+        self._grouped = tuple(i for i, field in enumerate(self._fields) if field not in {'version', 'pipe'})
+        self._versioned = 'version' in self._fields
+        self._version_index = self._fields.index('version') if self._versioned else None
+        self._groups = {}  # {group: {version: name}}
+        self.update(names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def _group_of(self, values: tuple) -> tuple:
+        return tuple(values[i] for i in self._grouped)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def add(self, name: str):
+        """Index `name`.
+
+        :raises ValueError: If `name` is not valid for this index name class.
+        """
+        if name in self._names:
+            return
+        matched = self._match(name)
+        if not matched:
+            raise ValueError(f"Can't index invalid {self.name_type.__name__} name '{name}'")
+        values = matched.group(*self._indices) if len(self._indices) > 1 else (matched.group(*self._indices),)
+        self._names[name] = values
+        for field, value in zip(self._fields, values):
+            postings = self._postings[field]
+            if value not in postings:
+                postings[value] = set()
+                if value is not None:
+                    bisect.insort(self._sorted[field], value)
+            postings[value].add(name)
+        if self._versioned:
+            self._groups.setdefault(self._group_of(values), {})[int(values[self._version_index])] = name
+
+    def update(self, names: typing.Iterable[str]) -> typing.List[str]:
+        """Index all valid `names`.
+
+        :returns: Names that were not indexed because they are invalid.
+        """
+        invalid = []
+        for name in names:
+            try:
+                self.add(name)
+            except ValueError:
+                invalid.append(name)
+        return invalid
+
+    def remove(self, name: str):
+        """Remove `name` from the index.
+
+        :raises KeyError: If `name` is not indexed.
+        """
+        values = self._names.pop(name)
+        for field, value in zip(self._fields, values):
+            postings = self._postings[field]
+            postings[value].discard(name)
+            if not postings[value]:
+                del postings[value]
+                if value is not None:
+                    sorted_values = self._sorted[field]
+                    del sorted_values[bisect.bisect_left(sorted_values, value)]
+        if self._versioned:
+            group = self._group_of(values)
+            versions = self._groups[group]
+            del versions[int(values[self._version_index])]
+            if not versions:
+                del self._groups[group]
+
+    def discard(self, name: str):
+        """Remove `name` from the index if it is indexed."""
+        if name in self._names:
+            self.remove(name)
+
+    def _candidates(self, postings: typing.List[set]) -> typing.Set[str]:
+        if not postings:
+            return set(self._names)
+        smallest, *others = sorted(postings, key=len)
+        return smallest.intersection(*others)
+
+    def query(self, **fields) -> typing.Set[str]:
+        """Get names whose field values are equal to all given `fields`."""
+        postings = []
+        for field, value in fields.items():
+            posting = self._postings[field].get(str(value))
+            if not posting:
+                return set()
+            postings.append(posting)
+        return self._candidates(postings)
+
+    def query_prefix(self, **prefixes) -> typing.Set[str]:
+        """Get names whose field values start with all given `prefixes`."""
+        postings = []
+        for field, prefix in prefixes.items():
+            prefix = str(prefix)
+            sorted_values = self._sorted[field]
+            field_postings = self._postings[field]
+            matched = set()
+            for value in itertools.islice(sorted_values, bisect.bisect_left(sorted_values, prefix), None):
+                if not value.startswith(prefix):
+                    break
+                matched.update(field_postings[value])
+            if not matched:
+                return set()
+            postings.append(matched)
+        return self._candidates(postings)
+
+    def latest(self, **fields) -> typing.List[str]:
+        """Get the name with the highest `version` for every group of names (equal in all other fields) matching `fields`.
+
+        :raises ValueError: If the index name class has no `version` field.
+        """
+        if not self._versioned:
+            raise ValueError(f"{self.name_type.__name__} names have no 'version' field")
+        names = self._names
+        groups = {self._group_of(names[name]) for name in self.query(**fields)} if fields else self._groups
+        return [versions[max(versions)] for versions in map(self._groups.__getitem__, groups)]
+
+
+class AssetResolver:
+    """Resolve asset names to the paths of their existing files under a `root` directory, with :mod:`asyncio`.
+
+    File system checks run in batches on a bounded thread pool, so resolving many names takes about as long as
+    the slowest batches instead of the sum of all checks. Results (found or not) are cached for `ttl` seconds,
+    and a name requested again while it is being resolved waits for the same check.
+
+    :param root: Directory the `path` of names is relative to.
+    :param name_type: Name class of the names to resolve.
+    :param sep: Separator of the names. Defaults to the one of `name_type`.
+    :param latest: Resolve to the file of the latest existing version of the series of each name (see
+        :meth:`CGAssetFile.latest`), instead of the version of the name.
+    :param max_workers: Threads checking the file system.
+    :param ttl: Seconds to cache results for.
+    :param batch_size: Maximum names checked by a single thread pool task.
+
+    Example:
+        >>> async def open_stage(names):
+        ...     async with AssetResolver('/mnt/assets', latest=True) as resolver:
+        ...         return await resolver.resolve_many(names)
+        ...
+        >>> asyncio.run(open_stage(['demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda', 'missing-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usda']))
+        [PosixPath('/mnt/assets/demo/3d/abc/entity/rnd/main/atom/lead/base/whole/3/demo-3d-abc-entity-rnd-main-atom-lead-base-whole.3.usda'), None]
+
+    .. note::
+        A resolver should only be used from the event loop (thread) that first resolves with it.
+    """
+
+    def __init__(
+            self,
+            root: typing.Union[str, os.PathLike],
+            name_type: typing.Type[CGAssetFile] = UsdAsset,
+            sep: str = None,
+            latest: bool = False,
+            max_workers: int = 8,
+            ttl: float = 60.0,
+            batch_size: int = 64,
+    ):
+        self.root = pathlib.Path(root)
+        self.name_type = name_type
+        self.latest = latest
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self._proto = name_type._prototype(sep)
+        self._max_workers = max_workers
+        self._executor = None
+        self._cache = {}  # {name: (expiry time, path or None)}
+        self._pending = {}  # {name: future of its path}, while being resolved
+        self._purge_time = time.monotonic() + ttl
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the thread pool checking the file system. It is started again if more names are resolved."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def clear(self):
+        """Forget all cached results."""
+        self._cache.clear()
+
+    async def resolve(self, name: str) -> typing.Optional[pathlib.Path]:
+        """Get the path of the existing file of `name`, or None if it can't be found. See :meth:`resolve_many`."""
+        return (await self.resolve_many([name]))[0]
+
+    async def resolve_many(self, names: typing.Iterable[str]) -> typing.List[typing.Optional[pathlib.Path]]:
+        """Get the path of the existing file of each of `names` (None for the ones that can't be found), in order.
+
+        :raises NameValidationError: If any of the names is invalid. Nothing is resolved then.
+        """
+        import asyncio
+        names = list(names)
+        now = time.monotonic()
+        cache, pending = self._cache, self._pending
+        if now >= self._purge_time:  # evict expired results every once in a while, not only when requested again
+            for name in [name for name, (expiry, __) in cache.items() if expiry <= now]:
+                del cache[name]
+            self._purge_time = now + self.ttl
+        results, waiting, missing = {}, {}, []
+        for name in dict.fromkeys(names):
+            cached = cache.get(name)
+            if cached is not None and cached[0] > now:
+                results[name] = cached[1]
+            elif name in pending:
+                waiting[name] = pending[name]
+            else:
+                missing.append(name)
+        if missing:
+            targets = [self._target(name) for name in missing]
+            loop = asyncio.get_running_loop()
+            if self._executor is None:
+                from concurrent import futures
+                self._executor = futures.ThreadPoolExecutor(self._max_workers, thread_name_prefix='AssetResolver')
+            for start in range(0, len(missing), self.batch_size):
+                batch = missing[start:start + self.batch_size]
+                found = [loop.create_future() for __ in batch]
+                pending.update(zip(batch, found))
+                waiting.update(zip(batch, found))
+                checks = loop.run_in_executor(self._executor, self._find_all, targets[start:start + self.batch_size])
+                checks.add_done_callback(functools.partial(self._resolved, batch, found))
+        if waiting:
+            # unlike gather, wait does not cancel futures shared with other callers when this one is cancelled
+            await asyncio.wait(waiting.values())
+            results.update((name, future.result()) for name, future in waiting.items())
+        return [results[name] for name in names]
+
+    def _target(self, name: str) -> tuple:
+        """Get the (directory with the version directories of `name`, name before its version, after it, version)."""
+        proto = self._proto
+        path = self.root / self.name_type(name, sep=proto.sep).path
+        start, end = proto._convention.regex.match(name).span('version')
+        return path.parent.parent, name[:start], name[end:], name[start:end]
+
+    def _find_all(self, targets: typing.List[tuple]) -> typing.List[typing.Optional[pathlib.Path]]:
+        return [self._find(*target) for target in targets]
+
+    def _find(self, directory: pathlib.Path, head: str, tail: str, version: str) -> typing.Optional[pathlib.Path]:
+        if self.latest:
+            valid = self._proto._convention.patterns['version'].fullmatch
+            entries = _list_directory(directory)
+            versions = sorted((entry for entry, is_dir in entries if is_dir and valid(entry)), key=int)
+        else:
+            versions = [version]
+        for version in reversed(versions):
+            path = directory / version / f'{head}{version}{tail}'
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def _resolved(self, names: typing.List[str], found: list, checks):
+        """Cache the paths of `names` checked on the thread pool and set them on their `found` futures."""
+        for name in names:
+            del self._pending[name]
+        if checks.cancelled():
+            for future in found:
+                future.cancel()
+            return
+        if (error := checks.exception()) is not None:
+            for future in found:
+                future.set_exception(error)
+            return
+        expiry = time.monotonic() + self.ttl
+        for name, future, path in zip(names, found, checks.result()):
+            self._cache[name] = (expiry, path)
+            future.set_result(path)
+
+
+_METRICS = {}
+_METRICS_LOCK = threading.Lock()
+_METRICS_STATE = threading.local()  # per thread: whether an instrumented operation is already being measured
+_METRICS_ORIGINALS = {}  # (owner, attribute): original member (None when inherited), while metrics are enabled
+_METRICS_CALLBACK = None
+_LATENCY_BOUNDS = (1e-6, 2e-6, 5e-6, 1e-5, 2e-5, 5e-5, 1e-4, 2e-4, 5e-4, 1e-3, 1e-2, 1e-1, float('inf'))
+"""Upper bounds (in seconds) of the latency histogram buckets of :func:`metrics`."""
+
+
+@contextlib.contextmanager
+def _measured(cls: type, operation: str):
+    """Record the latency of the wrapped `operation` of `cls`, and whether it failed validation (raised ValueError).
+
+    Operations run by another measured one (e.g. the `get` of a `path`) are part of it and are not recorded.
+    """
+    state = _METRICS_STATE
+    if getattr(state, 'active', False):
+        yield
+        return
+    state.active = True
+    failed = False
+    start = time.perf_counter()
+    try:
+        yield
+    except ValueError:
+        failed = True
+        raise
+    finally:
+        seconds = time.perf_counter() - start
+        try:
+            key = (cls.__qualname__, operation)
+            with _METRICS_LOCK:
+                try:
+                    entry = _METRICS[key]
+                except KeyError:
+                    entry = _METRICS[key] = [0, 0, 0.0, [0] * len(_LATENCY_BOUNDS)]
+                entry[0] += 1
+                entry[1] += failed
+                entry[2] += seconds
+                entry[3][bisect.bisect_left(_LATENCY_BOUNDS, seconds)] += 1
+            if (callback := _METRICS_CALLBACK) is not None:
+                callback(key[0], operation, seconds, failed)
+        finally:
+            state.active = False
+
+
+def _instrumented_members() -> typing.Dict[typing.Tuple[type, str], typing.Any]:
+    """Get the measured replacements of the instrumented name members, keyed by (owner class, attribute)."""
+    name_property = vars(DefaultName)['name']
+    get_default = vars(DefaultName)['get_default'].__func__
+
+    def set_name(self, name):
+        with _measured(type(self), 'parse'):
+            name_property.fset(self, name)
+
+    def get(self, **values):
+        with _measured(type(self), 'get'):
+            return super(DefaultName, self).get(**values)
+
+    def get_default_measured(cls, **kwargs):
+        with _measured(cls, 'get_default'):
+            return get_default(cls, **kwargs)
+
+    def path(self):
+        with _measured(type(self), 'path'):
+            return super(DefaultFile, self).path
+
+    def set_field(field_set):
+        @functools.wraps(field_set)
+        def set_field_measured(self, obj, val):
+            with _measured(type(obj), 'set'):
+                field_set(self, obj, val)
+        return set_field_measured
+
+    functools.update_wrapper(get_default_measured, get_default)
+    return {
+        (_FieldValue, '__set__'): set_field(_FieldValue.__set__),
+        (_DateTimeField, '__set__'): set_field(_DateTimeField.__set__),
+        (DefaultName, 'name'): name_property.setter(set_name),
+        (DefaultName, 'get'): functools.wraps(naming.Name.get)(get),
+        (DefaultName, 'get_default'): classmethod(get_default_measured),
+        (DefaultFile, 'path'): property(functools.wraps(naming.File.path.fget)(path)),
+    }
+
+
+def enable_metrics(callback: typing.Optional[typing.Callable[[str, str, float, bool], typing.Any]] = None):
+    """Start measuring how many names are parsed and built, and how long it takes, per name class.
+
+    Measured operations of :class:`DefaultName` subclasses are ``parse`` (setting a name, including on creation),
+    ``set`` (setting a field value), ``get``, ``get_default`` and ``path``. Read the results with :func:`metrics`.
+
+    Metrics are off by default: name members are only replaced by measured ones while enabled, so there is no
+    overhead otherwise. Operations run by another measured one (e.g. the ``get`` of a ``path``) count as part of it.
+
+    :param callback: If given, called on every measured operation with the name class, the operation, the elapsed
+                     seconds and whether it failed validation, e.g. to forward them to a metrics system.
+                     Names created or parsed by the callback are not measured.
+
+    Example:
+        >>> enable_metrics()
+        >>> name = CGAsset.get_default(kingdom='world')
+        >>> name.get(kingdom='other')
+        'demo-3d-other-entity-rnd-main-atom-lead-base-whole'
+        >>> try:
+        ...     name.name = 'invalid'
+        ... except NameValidationError:
+        ...     pass
+        ...
+        >>> stats = metrics(reset=True)['CGAsset']
+        >>> stats['get_default']['count'], stats['get']['count'], stats['parse']['count'], stats['parse']['errors']
+        (1, 1, 1, 1)
+        >>> disable_metrics()
+    """
+    global _METRICS_CALLBACK
+    with _METRICS_LOCK:
+        _METRICS_CALLBACK = callback
+        if _METRICS_ORIGINALS:
+            return
+        for (owner, attribute), member in _instrumented_members().items():
+            _METRICS_ORIGINALS[owner, attribute] = vars(owner).get(attribute)
+            setattr(owner, attribute, member)
+
+
+def disable_metrics():
+    """Stop measuring name operations and restore the original members. Metrics recorded so far are kept."""
+    global _METRICS_CALLBACK
+    with _METRICS_LOCK:
+        _METRICS_CALLBACK = None
+        for (owner, attribute), member in _METRICS_ORIGINALS.items():
+            if member is None:
+                delattr(owner, attribute)
+            else:
+                setattr(owner, attribute, member)
+        _METRICS_ORIGINALS.clear()
+
+
+def metrics(reset: bool = False) -> typing.Dict[str, typing.Dict[str, dict]]:
+    """Get a snapshot of the recorded metrics, as ``{name class: {operation: metrics}}``.
+
+    The metrics of each operation are its ``count``, the ``errors`` (failed validations) among them, the total
+    ``seconds`` and a latency ``histogram`` with the count of operations up to each bound (in seconds).
+
+    :param reset: Clear the recorded metrics after taking the snapshot.
+    """
+    with _METRICS_LOCK:
+        snapshot = {}
+        for (class_name, operation), (count, errors, seconds, buckets) in _METRICS.items():
+            snapshot.setdefault(class_name, {})[operation] = dict(
+                count=count, errors=errors, seconds=seconds, histogram=dict(zip(_LATENCY_BOUNDS, buckets)),
+            )
+        if reset:
+            _METRICS.clear()
+    return snapshot
+
+
+# keep token derived configs up to date when token files are reloaded
+ids.subscribe(_reload_token_configs)
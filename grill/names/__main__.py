@@ -0,0 +1,130 @@
+"""Command line tools for grill names.
+
+Validate names (or paths) against a naming convention, one per line, printing results as JSON Lines::
+
+    python -m grill.names validate --type UsdAsset names.txt
+    find /mnt/assets -type f | python -m grill.names validate --type UsdAsset --paths --errors-only
+"""
+import os
+import sys
+import json
+import typing
+import argparse
+import fileinput
+import itertools
+import collections
+
+from grill import names
+
+_TYPES = {
+    cls.__name__: cls for cls in (
+        names.CGAsset, names.CGAssetFile, names.UsdAsset, names.LifeTR, names.DateTimeFile,
+    )
+}
+
+
+def _validate(type_name: str, sep: str, paths: bool, errors_only: bool, lines: list) -> list:
+    """Get the (valid, JSON result) of validating each of `lines` as names (or paths) of the `type_name` class."""
+    cls = _TYPES[type_name]
+    prototype = getattr(cls, '_prototype', None)  # shared empty name of DefaultName classes
+    proto = prototype(sep) if prototype else cls() if sep is None else cls(sep=sep)
+    match = proto._BaseName__regex.match
+    located = paths and hasattr(cls, 'path')
+    check = getattr(proto, '_validate_values', None)  # validation beyond the pattern (e.g. DateTimeFile)
+    results = []
+    for line in lines:
+        name = os.path.basename(line) if paths else line
+        matched = match(name)
+        if matched is None:
+            result = {'input': line, 'valid': False, 'error': 'Name does not match the convention'}
+            if isinstance(proto, names.DefaultName) and (error := names.NameValidationError(proto, name)).field:
+                reason = f"Field '{error.field}' has invalid value '{error.value}', expected pattern: '{error.pattern}'"
+                result.update(error=reason, field=error.field)
+            results.append((False, json.dumps(result)))
+            continue
+        fields = matched.groupdict()
+        try:
+            if check:
+                check(fields)
+            if located and not _endswith(line, (path := cls(name, sep=proto.sep).path).parts):
+                raise ValueError(f"Expected to be at '{path}'")
+        except ValueError as exc:
+            results.append((False, json.dumps({'input': line, 'valid': False, 'error': str(exc)})))
+            continue
+        fields = {k: v for k, v in fields.items() if v is not None}
+        if not errors_only:
+            results.append((True, json.dumps({'input': line, 'valid': True, 'fields': fields})))
+    return results
+
+
+def _endswith(path: str, parts: tuple) -> bool:
+    segments = path.replace('\\', '/').split('/')
+    return tuple(segments[-len(parts):]) == parts
+
+
+def _chunks(lines: typing.Iterable[str], size: int) -> typing.Iterator[list]:
+    lines = (line.rstrip('\r\n') for line in lines)
+    lines = (line for line in lines if line)
+    while chunk := list(itertools.islice(lines, size)):
+        yield chunk
+
+
+def _results(arguments: argparse.Namespace, chunks: typing.Iterable[list]) -> typing.Iterator[tuple]:
+    """Yield validation results of `chunks` in order, with at most a couple of chunks per worker in memory."""
+    validate = lambda chunk: (arguments.type, arguments.sep, arguments.paths, arguments.errors_only, chunk)
+    if not arguments.workers:
+        for chunk in chunks:
+            yield from _validate(*validate(chunk))
+        return
+
+    from concurrent import futures
+    with futures.ProcessPoolExecutor(arguments.workers) as executor:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_validate, *validate(chunk)))
+            if len(pending) >= arguments.workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def validate(arguments: argparse.Namespace) -> int:
+    """Print JSON Lines validation results of the names in `arguments.files`, and get 1 if any is invalid."""
+    exit_code = 0
+    write = sys.stdout.write
+    with fileinput.input(arguments.files or ('-',)) as lines:
+        for valid, result in _results(arguments, _chunks(lines, arguments.chunk_size)):
+            exit_code = exit_code or int(not valid)
+            write(f'{result}\n')
+    return exit_code
+
+
+def main(argv=None) -> int:
+    """Run the command line with `argv` arguments (defaults to :data:`sys.argv`) and get its exit code."""
+    parser = argparse.ArgumentParser(prog='python -m grill.names', description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    validate_parser = commands.add_parser(
+        'validate',
+        help='Validate names, one per line, printing results as JSON Lines.',
+        description='Validate names, one per line, printing results as JSON Lines. Exits with 1 if any is invalid.',
+    )
+    validate_parser.add_argument('files', nargs='*', help="Files to read names from. Defaults to stdin ('-').")
+    validate_parser.add_argument('--type', default='CGAssetFile', choices=sorted(_TYPES), help='Name class to validate against.')
+    validate_parser.add_argument('--sep', help='Separator of the names. Defaults to the one of the name class.')
+    validate_parser.add_argument(
+        '--paths', action='store_true',
+        help='Lines are paths: validate their file names, and their location for classes with a path.',
+    )
+    validate_parser.add_argument('--errors-only', action='store_true', help='Only print results of invalid names.')
+    validate_parser.add_argument(
+        '--workers', type=int, default=os.cpu_count(),
+        help='Processes to validate with. Use 0 to validate in this process. Defaults to the CPU count.',
+    )
+    validate_parser.add_argument('--chunk-size', type=int, default=10_000, help='Names sent to a process at a time.')
+    validate_parser.set_defaults(function=validate)
+    arguments = parser.parse_args(argv)
+    return arguments.function(arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
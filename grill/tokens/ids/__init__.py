@@ -1,8 +1,23 @@
+"""Token registries, loaded from ``{name}.cfg`` files and exposed as enums of :class:`_TokenID` members.
+
+Token files are searched for in (highest priority first):
+
+- Paths added via :func:`add_search_path` (or :func:`add_entry_point_paths`), last added first.
+- This package.
+
+Once loaded, tokens are kept in memory and getting them does no I/O. Call :func:`refresh` (or start a polling thread
+via :func:`watch`) to pick up changes on disk; callbacks registered via :func:`subscribe` are notified of them.
+
+All functions are thread safe. Concurrent first lookups of the same tokens load them once, so every thread gets the
+same enum, and reloads replace it without ever exposing a partially loaded one.
+"""
+import os
 import enum
 import typing
-import configparser
-from importlib import resources
-from functools import lru_cache
+import marshal
+import threading
+
+_CACHE_VERSION = 1
 
 
 class _TokenID(typing.NamedTuple):
@@ -12,18 +27,204 @@ class _TokenID(typing.NamedTuple):
     default: str = ''
 
 
-@lru_cache()
+class _Registered(typing.NamedTuple):
+    path: str
+    stamp: tuple  # (mtime_ns, size) of `path` when it was loaded
+    tokens: enum.EnumMeta
+
+
+_search_paths = []  # highest priority last
+_registry = {}  # {name: _Registered}, entries are replaced (never mutated) on reload
+_subscribers = []
+_lock = threading.RLock()
+
+
+def _cache_path(cfg_path: str) -> str:
+    head, tail = os.path.split(cfg_path)
+    return os.path.join(head, '__pycache__', f'{tail}.marshal')
+
+
+def _parse(text: str) -> tuple:
+    import configparser  # only needed when the cache is missing or outdated
+    cfg = configparser.ConfigParser()
+    try:
+        cfg.read_string(text)
+    except configparser.Error as exc:
+        raise ValueError(f"Invalid token file contents: {exc}") from exc
+    return tuple((s, tuple(cfg[s].items())) for s in cfg.sections())
+
+
+def _load_sections(cfg_path: str) -> tuple:
+    """Get the ((section, ((key, value), ...)), ...) contents of the token file at `cfg_path`.
+
+    Parsed contents are cached in a marshal file under ``__pycache__`` next to `cfg_path`, which stays the source
+    of truth: the cache is used while the file mtime and size are unchanged, or while its content hash matches.
+    """
+    stamp = _stamp(cfg_path)
+    cache_path = _cache_path(cfg_path)
+    try:
+        with open(cache_path, 'rb') as cache:
+            version, cached_stamp, cached_digest, sections = marshal.load(cache)
+    except (OSError, EOFError, ValueError, TypeError):  # missing, unreadable or corrupt cache
+        version = cached_stamp = cached_digest = sections = None
+    if version == _CACHE_VERSION and cached_stamp == stamp:
+        return sections
+
+    import hashlib
+    with open(cfg_path, 'rb') as cfg:
+        data = cfg.read()
+    digest = hashlib.sha256(data).hexdigest()
+    if version != _CACHE_VERSION or cached_digest != digest:
+        sections = _parse(data.decode('utf-8'))
+
+    temp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, 'wb') as cache:
+            marshal.dump((_CACHE_VERSION, stamp, digest, sections), cache)
+        os.replace(temp_path, cache_path)  # atomic, concurrent readers never see a partial cache
+    except OSError:  # e.g. read-only installations, keep going without a cache
+        pass
+    return sections
+
+
+def _stamp(path: str) -> tuple:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _paths() -> list:
+    return [*reversed(_search_paths), os.path.dirname(__file__)]
+
+
+def _find(name: str) -> typing.Optional[str]:
+    for directory in _paths():
+        path = os.path.join(directory, f'{name}.cfg')
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _register(name: str, path: str) -> _Registered:
+    stamp = _stamp(path)  # before loading, so changes made while loading are picked up by the next refresh
+    tokens = enum.Enum(name, ((s, _TokenID(**dict(items))) for s, items in _load_sections(path)))
+    registered = _registry[name] = _Registered(path, stamp, tokens)
+    return registered
+
+
 def __getattr__(name):
-    cfg_fname = f'{name}.cfg'
-    if resources.is_resource(__name__, cfg_fname):
-        cfg = configparser.ConfigParser()
-        cfg.read_string(resources.read_text(__name__, cfg_fname))
-        return enum.Enum(name, ((s, _TokenID(**cfg[s])) for s in cfg.sections()))
+    try:
+        return _registry[name].tokens
+    except KeyError:
+        pass
+    if not name.startswith('__'):  # avoid searching disk for dunder lookups from the import system and tools
+        with _lock:
+            registered = _registry.get(name)  # may have been loaded while waiting for the lock
+            if registered is None and (path := _find(name)):
+                registered = _register(name, path)
+        if registered:
+            return registered.tokens
     raise AttributeError(f"module {__name__} has no attribute {name}")
 
 
 def __dir__():
-    return tuple(
-        # how to do better?
-        c.split('.cfg')[0] for c in resources.contents(__name__) if c.endswith('.cfg')
-    )
+    return tuple(sorted({
+        c.split('.cfg')[0] for directory in _paths() if os.path.isdir(directory)
+        for c in os.listdir(directory) if c.endswith('.cfg')
+    }))
+
+
+def add_search_path(path: typing.Union[str, os.PathLike]):
+    """Add a directory to search token files in, with priority over existing ones.
+
+    Tokens already loaded that are provided by the new path are reloaded.
+    """
+    with _lock:
+        _search_paths.append(os.fspath(path))
+        refresh()
+
+
+def add_entry_point_paths(group: str = 'grill.tokens.ids'):
+    """Add search paths provided by installed packages through the `group` entry point group.
+
+    Entry points should load to a directory path, an iterable of directory paths or a callable returning either.
+    Discovering entry points inspects the metadata of every installed distribution, so it is done on demand only.
+    """
+    from importlib import metadata
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        entry_points = entry_points.select(group=group)
+    else:  # python < 3.10
+        entry_points = entry_points.get(group, ())
+    paths = []
+    for entry_point in entry_points:
+        loaded = entry_point.load()
+        loaded = loaded() if callable(loaded) else loaded
+        paths.extend([loaded] if isinstance(loaded, (str, os.PathLike)) else loaded)
+    with _lock:
+        _search_paths.extend(os.fspath(path) for path in paths)
+        refresh()
+
+
+def remove_search_path(path: typing.Union[str, os.PathLike]):
+    """Remove a directory previously added via :func:`add_search_path`.
+
+    Tokens already loaded from it are reloaded from the remaining paths (or removed if no longer found).
+    """
+    with _lock:
+        _search_paths.remove(os.fspath(path))
+        refresh()
+
+
+def subscribe(callback: typing.Callable[[typing.FrozenSet[str]], None]):
+    """Call `callback` with the names of tokens that changed whenever :func:`refresh` swaps them."""
+    with _lock:
+        _subscribers.append(callback)
+
+
+def refresh() -> typing.FrozenSet[str]:
+    """Reload tokens whose files changed on disk since they were loaded.
+
+    Only ``stat`` calls are performed for unchanged files. Token files that fail to load keep serving their
+    previously loaded tokens.
+
+    :returns: Names of the tokens that changed.
+    """
+    changed = set()
+    with _lock:
+        for name, registered in list(_registry.items()):
+            path = _find(name)
+            if path is None:
+                del _registry[name]
+                changed.add(name)
+                continue
+            try:
+                if path == registered.path and _stamp(path) == registered.stamp:
+                    continue
+                reloaded = _register(name, path)
+            except (OSError, ValueError, TypeError):  # e.g. a file being edited, keep previous tokens
+                continue
+            if [(t.name, t.value) for t in reloaded.tokens] == [(t.name, t.value) for t in registered.tokens]:
+                _registry[name] = registered._replace(path=reloaded.path, stamp=reloaded.stamp)  # keep same enum
+            else:
+                changed.add(name)
+        changed = frozenset(changed)
+        if changed:
+            for callback in _subscribers:
+                callback(changed)
+    return changed
+
+
+def watch(interval: float = 1.0) -> threading.Event:
+    """Call :func:`refresh` every `interval` seconds on a daemon thread.
+
+    :returns: An event that stops watching when set.
+    """
+    stop = threading.Event()
+
+    def poll():
+        while not stop.wait(interval):
+            refresh()
+
+    threading.Thread(target=poll, name=f'{__name__}.watch', daemon=True).start()
+    return stop
@@ -1,7 +1,35 @@
+import gc
+import io
+import os
+import pickle
+import sys
+import json
+import array
+import asyncio
+import time
+import types
+import weakref
+import shutil
+import tempfile
 import unittest
+import contextlib
+import threading
+import subprocess
+from unittest import mock
+from concurrent import futures
 from pathlib import Path
+from datetime import datetime, timedelta, timezone
 
+import naming
+
+import grill.names
 from grill.names import *
+from grill.tokens import ids
+
+try:
+    import numpy
+except ImportError:  # optional
+    numpy = None
 
 
 class TestNames(unittest.TestCase):
@@ -27,6 +55,131 @@ class TestNames(unittest.TestCase):
         self.assertEqual('rig', name.area)
         self.assertEqual('demo 3d abc entity rig dev atom lead base leg.skin.1.ext', name.get())
 
+    def test_convention_cache(self):
+        first, second = CGAssetFile(), CGAssetFile.get_default()
+        self.assertIs(first._convention, second._convention)
+        self.assertIsNot(first._convention, CGAsset()._convention)
+        second.sep = '_'
+        self.assertIsNot(first._convention, second._convention)
+        self.assertEqual('demo_3d_abc_entity_rnd_main_atom_lead_base_whole.1.ext', second.name)
+        self.assertIs(second._convention, CGAssetFile(sep='_')._convention)
+
+        class Released(UsdAsset):
+            pass
+
+        Released.get_default().path
+        Released.parse_many([Released._prototype('_').get()], sep='_')
+        released = weakref.ref(Released)
+        del Released
+        gc.collect()
+        self.assertIsNone(released())  # caches don't keep classes created at runtime alive
+
+        class Changing(DefaultName):
+            config = dict(base=r'\w+')
+
+        self.assertEqual('hello', Changing('hello').base)
+        Changing.config = dict(base=r'\d+')
+        Changing.__init_subclass__()  # re-solve class config
+        self.assertEqual('42', Changing('42').base)
+        with self.assertRaises(ValueError):
+            Changing('hello')
+
+    def test_token_reload(self):
+        class Subclassed(UsdAsset):
+            config = dict(area=r'model|rig')
+
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        with open(os.path.join(tempdir, 'CGAsset.cfg'), 'w') as cfg:
+            cfg.write("[code]\nshort_name = co\ndefault = demo\ndescription = Code.\npattern = [a-z]+\n"
+                      "[area]\nshort_name = a\ndefault = rnd\ndescription = Area.\n"
+                      "[shot]\nshort_name = sh\ndefault = sh010\ndescription = Shot.\n")
+        ids.add_search_path(tempdir)
+        try:
+            self.assertEqual(['code', 'area', 'shot'], list(CGAsset.config))
+            self.assertEqual('demo-rnd-sh010.1.usd', UsdAsset.get_default().name)
+            self.assertEqual('sh020', UsdAsset('demo-rnd-sh020.1.usda').shot)
+            with self.assertRaises(ValueError):
+                CGAssetFile('d3mo-rnd-sh020.1.ext')
+            self.assertIn('Code.', CGAsset.__doc__)
+            # subclasses keep their own declared configs
+            self.assertEqual('rig', Subclassed('demo-rig-sh010.1.usd').area)
+            with self.assertRaises(ValueError):
+                Subclassed('demo-rnd-sh010.1.usd')
+        finally:
+            ids.remove_search_path(tempdir)
+        self.assertEqual('demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usd', UsdAsset.get_default().name)
+        self.assertEqual('model', Subclassed('demo-3d-abc-entity-model-main-atom-lead-base-whole.1.usd').area)
+
+    def test_paths_for(self):
+        rows = [dict(area='model', version=3), dict(area='rig', suffix='abc', output='cache', index=2), {}]
+        expected = [str(CGAssetFile.get_default(**row).path) for row in rows]
+        self.assertEqual(expected, CGAssetFile.paths_for(rows))
+        self.assertEqual([Path(p) for p in expected], CGAssetFile.paths_for(rows, pure=True))
+        columns = dict(area=['model', 'rig'], version=[3, 4])
+        self.assertEqual(
+            [str(UsdAsset.get_default(area=area, version=version).path) for area, version in zip(*columns.values())],
+            UsdAsset.paths_for(columns, validate=True),
+        )
+        with self.assertRaises(ValueError):
+            UsdAsset.paths_for([dict(suffix='abc')], validate=True)
+
+        names = [UsdAsset.get_default(version=2).name, UsdAsset.get_default(output='cache', index=3).name, 'bad.usd']
+        parsed = UsdAsset.parse_many(names)
+        parsed.fields['version'] = ['9', '9', None]  # pipe is solved again from its members
+        expected = [
+            str(UsdAsset.get_default(version=9).path),
+            str(UsdAsset.get_default(output='cache', index=3, version=9).path),
+            None,
+        ]
+        self.assertEqual(expected, UsdAsset.paths_for(parsed.fields, validate=True))
+
+        class TimedAssetFile(DateTimeFile, CGAssetFile):  # "date" and "time" are compounds of their members
+            pass
+
+        class Piped(CGAssetFile):
+            pipe_sep = '~'
+
+        moment = dict(year=2000, month=1, day=2, hour=3, minute=4, second=5, microsecond=6)
+        for cls, row in ((TimedAssetFile, dict(area='x', **moment)), (Piped, dict(area='x', output='cache', index=2))):
+            with self.subTest(cls=cls):
+                self.assertEqual([str(cls.get_default(**row).path)], cls.paths_for([row], validate=True))
+        row = dict(area='x', output='cache')
+        underscored = CGAssetFile.get_default(**row).path
+        underscored = underscored.with_name(underscored.name.replace('-', '_'))
+        self.assertEqual([str(underscored)], CGAssetFile.paths_for([row], sep='_', validate=True))
+
+    def test_freeze(self):
+        name = UsdAsset.get_default(area='model', output='cache', index=3)
+        frozen = name.freeze()
+        self.assertEqual('model', frozen.area)
+        self.assertIsNone(UsdAsset.get_default().freeze().output)
+        with self.assertRaises(AttributeError):
+            frozen.missing
+        self.assertEqual(frozen, UsdAsset(name.name).freeze())
+        self.assertEqual(1, len({frozen, UsdAsset(name.name).freeze()}))
+        self.assertIs(frozen.area, UsdAsset(name.name).freeze().area)  # interned
+        self.assertEqual(('3', '3', 'cache'), (frozen.index, frozen['index'], frozen.output))  # not tuple members
+        with self.assertRaises(KeyError):
+            frozen['missing']
+        with self.assertRaises(AttributeError):
+            frozen.area = 'sorry'
+        self.assertEqual(frozen, pickle.loads(pickle.dumps(frozen)))
+
+        thawed = CGAssetFile.thaw(frozen)
+        self.assertIsInstance(thawed, UsdAsset)
+        self.assertEqual(name.name, thawed.name)
+        thawed.area = 'rig'  # independent from the snapshot
+        self.assertEqual('model', frozen.area)
+        with self.assertRaises(TypeError):
+            UsdAsset.thaw(CGAsset.get_default().freeze())
+
+        self.assertEqual('', CGAsset.thaw(CGAsset().freeze()).name)
+        spaced = CGAssetFile('demo 3d abc entity rnd main atom lead base whole.1.ext', sep=' ')
+        self.assertEqual(spaced.name, CGAssetFile.thaw(spaced.freeze()).name)
+        timed = DateTimeFile("1999-10-28 22-29-31-926548.txt")
+        self.assertEqual(timed.datetime, DateTimeFile.thaw(timed.freeze()).datetime)
+
     def test_cgasset(self):
         self.assertEqual(CGAsset().get(),
                          '{code}-{media}-{kingdom}-{cluster}-{area}-{stream}-{item}-{step}-{variant}-{part}')
@@ -77,6 +230,158 @@ class TestNames(unittest.TestCase):
 
         tf = SubTime("1999-10-28 1-1-1-1 subclassed.txt")
         self.assertEqual("subclassed", tf.extra)
+        with self.assertRaises(ValueError):
+            tf.day = 32
+        self.assertEqual("1999-10-28 1-1-1-1 subclassed.txt", tf.name)
+
+    def test_timestamps(self):
+        names = ['1970-1-1 0-0-1-0.txt', '1999-10-28 22-29-31-926548.txt', '2000-1-1 0-0-0-0.txt']
+        timestamps = DateTimeFile.timestamps(names)
+        self.assertEqual(
+            [int(DateTimeFile(name).datetime.replace(tzinfo=timezone.utc).timestamp() * 1e6) for name in names],
+            timestamps,
+        )
+        with self.assertRaises(ValueError):
+            DateTimeFile.timestamps(['not a datetime.txt'])
+        with self.assertRaises(ValueError):  # valid pattern, invalid date
+            DateTimeFile.timestamps(['1999-2-30 0-0-0-0.txt'])
+
+        built = DateTimeFile.from_timestamps(timestamps, suffix='txt')
+        self.assertEqual(names, [name.name for name in built])
+        self.assertEqual([DateTimeFile(name).values for name in names], [name.values for name in built])
+        self.assertEqual('1970-1-1', built[0].date)
+        with self.assertRaises(ValueError):
+            DateTimeFile.from_timestamps(timestamps, suffix='not valid')
+
+        self.assertEqual(slice(1, 2), DateTimeFile.time_slice(timestamps, datetime(1999, 1, 1), timestamps[2]))
+        self.assertEqual(slice(0, 3), DateTimeFile.time_slice(timestamps))
+        aware = datetime(2000, 1, 1, 1, tzinfo=timezone(timedelta(hours=1)))
+        self.assertEqual(names[2:], names[DateTimeFile.time_slice(timestamps, aware)])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_timestamps_numpy(self):
+        names = ['1970-1-1 0-0-1-0.txt', '1999-10-28 22-29-31-926548.txt', '2000-1-1 0-0-0-0.txt']
+        timestamps = DateTimeFile.timestamps(names, datetime64=True)
+        self.assertEqual(numpy.dtype('datetime64[us]'), timestamps.dtype)
+        self.assertEqual(DateTimeFile.timestamps(names), timestamps.astype('int64').tolist())
+        self.assertEqual(names, [name.name for name in DateTimeFile.from_timestamps(timestamps, suffix='txt')])
+        self.assertEqual(slice(1, 2), DateTimeFile.time_slice(timestamps, datetime(1999, 1, 1), timestamps[2]))
+        self.assertEqual(slice(1, 3), DateTimeFile.time_slice(timestamps, 1000001))
+
+    def test_validation_error(self):
+        name = UsdAsset.get_default()
+        with self.assertRaises(NameValidationError) as context:
+            name.suffix = 'abc'
+        error = context.exception
+        self.assertIsInstance(error, ValueError)
+        self.assertEqual(('suffix', 'abc'), (error.field, error.value))
+        self.assertEqual(name.get(suffix='abc'), error.name)
+        self.assertEqual(name._convention.patterns['suffix'].pattern, error.pattern)
+        self.assertIn("Field 'suffix' has invalid value 'abc'", str(error))
+        self.assertEqual('usd', name.suffix)
+
+        invalid = name.get(cluster='not valid')
+        with self.assertRaises(NameValidationError) as context:
+            UsdAsset(invalid)
+        error = context.exception
+        self.assertEqual(('cluster', 'not valid', ids.CGAsset.cluster.value.pattern), (error.field, error.value, error.pattern))
+        self.assertEqual(invalid, error.name)
+
+        for structural in (  # an extra segment and a missing one could be explained by many fields
+            name.name.replace('-whole.', '-whole-extra.'),
+            name.name.replace('-base-', '-'),
+        ):
+            with self.subTest(structural=structural), self.assertRaises(NameValidationError) as context:
+                UsdAsset(structural)
+            self.assertEqual((None, None), (context.exception.field, context.exception.value))
+            self.assertIn('Valid convention is', str(context.exception))
+
+        with self.assertRaises(NameValidationError) as context:
+            UsdAsset('garbage')
+        self.assertIsNone(context.exception.field)
+        self.assertIn('Valid convention is', str(context.exception))
+        with self.assertRaises(NameValidationError) as context:
+            UsdAsset('garbage', sep='_')
+        self.assertIn("Valid convention is: '{code}_{media}_", str(context.exception))
+
+        class Shifting(DefaultName):
+            config = dict(first=r'\w+', second=r'[\w-]+')
+
+        shifting = Shifting('a-b', sep='-')
+        with self.assertRaises(NameValidationError) as context:
+            shifting.first = 'x-y'  # 'x-y-b' matches the convention with first='x'
+        self.assertEqual(('first', 'x-y'), (context.exception.field, context.exception.value))
+        self.assertEqual('a-b', shifting.name)
+
+        self.assertTrue(UsdAsset.is_valid(name.name))
+        self.assertFalse(UsdAsset.is_valid(invalid))
+        self.assertFalse(UsdAsset.is_valid(None))
+        self.assertTrue(UsdAsset.is_valid(name.name.replace('-', '_'), sep='_'))
+        self.assertTrue(DateTimeFile.is_valid("1999-10-28 22-29-31-926548.txt"))
+        self.assertFalse(DateTimeFile.is_valid("1999-14-28 22-29-31-926548.txt"))
+        self.assertEqual({}, UsdAsset.validate_fields(area='model', version=3))
+        self.assertEqual(
+            {'suffix': name._convention.patterns['suffix'].pattern, 'missing': None},
+            UsdAsset.validate_fields(area='model', suffix='abc', missing='value'),
+        )
+
+    def test_splice_fields(self):
+        class Spliced(UsdAsset):
+            SPLICE_FIELDS = True
+            VERIFY_SPLICES = False
+
+        full, spliced = UsdAsset.get_default(), Spliced.get_default()
+        changes = [
+            ('version', 42), ('area', 'model'), ('suffix', 'usdc'), ('version', 7), ('output', 'cache'),
+            ('index', 3), ('output', 'geo'), ('code', 'longer_code'), ('index', 12), ('part', 'p'),
+        ]
+        for field, value in changes:
+            setattr(full, field, value)
+            setattr(spliced, field, value)
+            self.assertEqual(full.name, spliced.name)
+            self.assertEqual(full.values, spliced.values)
+        with self.assertRaises(NameValidationError):
+            spliced.version = 'v1'
+        self.assertEqual(full.name, spliced.name)
+
+        verified = UsdAsset.get_default()
+        verified.SPLICE_FIELDS = True  # per object
+        verified.version = 3
+        self.assertEqual('3', verified.version)
+        self.assertEqual('3', UsdAsset(verified.name).version)
+        for name in Spliced.anonymous_batch(2):  # names not created through a match
+            name.area = 'rig'
+            self.assertEqual(UsdAsset(name.name).values, name.values)
+
+        class SplicedTime(DateTimeFile):
+            SPLICE_FIELDS = True
+            VERIFY_SPLICES = False
+
+        timed = SplicedTime("2000-1-31 1-1-1-1.txt")
+        timed.month = 12
+        self.assertEqual(("2000-12-31", "12"), (timed.date, timed.month))
+        with self.assertRaises(ValueError):
+            timed.month = 2
+        self.assertEqual("2000-12-31 1-1-1-1.txt", timed.name)
+
+    def test_update(self):
+        tf = DateTimeFile("1999-10-31 1-1-1-1.txt")
+        with self.assertRaises(ValueError):
+            tf.month = 11  # no 31st of November
+        tf.update(month=11, day=30, hour=12)
+        self.assertEqual("1999-11-30 12-1-1-1.txt", tf.name)
+        with self.assertRaises(ValueError):
+            tf.update(year=2000, month=2, day=30)
+        with self.assertRaises(ValueError):
+            tf.name = "2001-02-29 1-1-1-1.txt"
+        self.assertEqual("1999-11-30 12-1-1-1.txt", tf.name)
+        self.assertEqual('11', tf.month)
+        tf.update()
+        self.assertEqual("1999-11-30 12-1-1-1.txt", tf.name)
+
+        name = UsdAsset.get_default()
+        name.update(area='model', version=3)
+        self.assertEqual(('model', '3'), (name.area, name.version))
 
     def test_default_suffix(self):
         suf1 = 'abc'
@@ -94,6 +399,177 @@ class TestNames(unittest.TestCase):
         self.assertEqual(ta.suffix, suf2)
 
 
+    def test_columns(self):
+        names = [
+            UsdAsset.get_default(area=area, version=version, **extra).name
+            for area in ('model', 'rig', 'model') for version in (1, 2)
+            for extra in ({}, dict(output='cache'), dict(output='cache', index=7))
+        ]
+        names.insert(3, 'not.valid')
+        columns = UsdAsset.to_columns(names)
+        self.assertNotIn('pipe', columns.codes)  # compounds are solved from their members
+        self.assertEqual(list(UsdAsset.parse_many(names).mask), [bool(invalid) for invalid in columns.mask])
+        self.assertEqual(('model', 'rig'), columns.categories['area'])
+        self.assertEqual({'model': 12, 'rig': 6}, columns.value_counts('area'))
+        self.assertEqual(('cache',), columns.categories['output'])
+        self.assertEqual(UsdAsset.parse_many(names).fields['index'], columns.values('index'))
+        self.assertEqual(-1, columns.codes['code'][3])
+        rebuilt = UsdAsset.from_columns(columns, validate=True)
+        self.assertEqual([None if name == 'not.valid' else name for name in names], rebuilt)
+
+        timed = [DateTimeFile.get_default(suffix='txt').name for __ in range(3)]
+        columns = DateTimeFile.to_columns(timed)
+        self.assertNotIn('date', columns.codes)
+        self.assertEqual(timed, DateTimeFile.from_columns(columns))
+        with self.assertRaises(ValueError):
+            DateTimeFile.from_columns(columns._replace(categories=dict(columns.categories, suffix=('.',))), validate=True)
+        self.assertEqual([], UsdAsset.from_columns(UsdAsset.to_columns([])))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_columns_numpy(self):
+        names = [UsdAsset.get_default(area=area).name for area in ('model', 'rig', 'model')] + ['not.valid']
+        columns = UsdAsset.to_columns(names)
+        array = columns.to_numpy()
+        self.assertEqual(list(columns.codes), list(array.dtype.names))
+        self.assertEqual([0, 1, 0, -1], array['area'].tolist())
+        codes = {field: array[field] for field in array.dtype.names}
+        self.assertEqual(UsdAsset.from_columns(columns), UsdAsset.from_columns(columns._replace(codes=codes)))
+
+    def test_segment_matching(self):
+        class Segmented(UsdAsset):
+            SEGMENT_MATCHING = True
+            # a restricted output makes the pattern fall back to a version with an index
+            pipe_config = naming.NameConfig(dict(pipe=r'\w+', output=r'[a-z]+', version=r'\d+', index=r'\d+'))
+
+        class SegmentedTime(DateTimeFile):
+            SEGMENT_MATCHING = True
+
+        base = 'demo-3d-abc-entity-rnd-main-atom-lead-base-whole'
+        names = [
+            f'{base}.1.usd', f'{base}.cache.1.usda', f'{base}.cache.1.2.usdc', f'{base}.1.2.usd', f'{base}.1.usd\n',
+            f'{base}.1.abc', f'{base}.1.2.3.usd', f'{base}.1', f'{base}.usd', f'{base}-extra.1.usd', f'{base}.1.usd\n\n',
+            f'{base}.cache.x.usd', f'{base}..1.usd', f'{base}.1.usd.', f'-{base}.1.usd', '', '.', 'not valid',
+            'demo-3d-abc-entity-rnd-main-atom-lead-base-wh ole.1.usd', f'{base}.1.usd'.replace('-', '--', 1),
+        ]
+        self.assertIsNotNone(Segmented()._convention.matcher)
+        for name in names:
+            with self.subTest(name=name):
+                matched = Segmented()._convention.regex.match(name)
+                self.assertEqual(matched and matched.groupdict(), Segmented()._convention.matcher(name))
+                self.assertEqual(bool(matched), Segmented.is_valid(name))
+        self.assertEqual('2', Segmented(f'{base}.1.2.usd').index)
+        self.assertEqual('1', Segmented(f'{base}.cache.1.usd').version)
+        with self.assertRaises(NameValidationError):
+            Segmented(f'{base}.1.abc')
+        segmented = Segmented.parse_many(names)
+        Segmented.SEGMENT_MATCHING = False
+        self.assertEqual(Segmented.parse_many(names), segmented)
+
+        timed = ['1999-10-28 22-29-31-926548.txt', '1999-10-28 22-29-31.txt', '1999-10-28  22-29-31-1.txt']
+        self.assertEqual(DateTimeFile.parse_many(timed), SegmentedTime.parse_many(timed))
+        self.assertEqual('926548', SegmentedTime(timed[0]).microsecond)
+        with self.assertRaises(ValueError):
+            SegmentedTime('1999-02-31 1-1-1-1.txt')
+
+        # field values could contain an underscore separator: the whole pattern is matched instead
+        self.assertIsNone(Segmented(sep='_')._convention.matcher)
+        self.assertEqual('rnd', Segmented(f'{base}.1.usd'.replace('-', '_'), sep='_').area)
+        self.assertIsNone(grill.names._segment_matcher(LifeTR(), LifeTR()._pattern, {}))
+
+        class Unparsed(UsdAsset):
+            SEGMENT_MATCHING = True
+
+        # e.g. a python version with a different private regular expression parser: no matcher, same results
+        with mock.patch.object(grill.names, '_regex_parser', side_effect=AttributeError('POSSESSIVE_REPEAT')):
+            self.assertIsNone(Unparsed()._convention.matcher)
+        self.assertEqual(UsdAsset.parse_many(names), Unparsed.parse_many(names))
+
+
+    def test_parse_cache(self):
+        class Cached(UsdAsset):
+            PARSE_CACHE = ParseCache(maxsize=2)
+
+        class Sub(Cached):
+            pass
+
+        cache = Cached.PARSE_CACHE
+        first, second, third = [UsdAsset.get_default(version=version).name for version in (1, 2, 3)]
+        name = Cached(first)
+        name.area = 'model'  # not shared with cached values
+        self.assertEqual(('rnd', '1'), (Cached(first).area, Cached(first).version))
+        self.assertEqual(dict(hits=2, misses=2, size=2, maxsize=2), cache.info())  # 'model' name was parsed too
+        self.assertEqual('rnd', Sub(first).area)  # cached per class
+        self.assertEqual(3, cache.misses)
+        Cached(second)
+        Cached(first)  # least recently used, discarded
+        self.assertEqual(5, cache.misses)
+        with self.assertRaises(ValueError):
+            Cached('not.valid')
+        with self.assertRaises(ValueError):
+            Cached('not.valid')
+        self.assertEqual(7, cache.misses)
+        underscored = Cached(third.replace('-', '_'), sep='_')
+        self.assertEqual(('rnd', '3'), (underscored.area, underscored.version))
+
+        spliced = Cached(third)
+        spliced.SPLICE_FIELDS = True
+        spliced.version = 4
+        self.assertEqual('4', spliced.version)
+        self.assertEqual(UsdAsset.get_default(version=4).name, spliced.name)
+        misses = cache.misses
+        spliced.name = third  # not cached when splicing
+        self.assertEqual(misses, cache.misses)
+        cache.clear()
+        self.assertEqual(dict(hits=0, misses=0, size=0, maxsize=2), cache.info())
+        self.assertEqual(0, len(cache))
+
+        class CachedTime(DateTimeFile):
+            PARSE_CACHE = ParseCache()
+
+        for __ in range(2):
+            with self.assertRaises(ValueError):
+                CachedTime("1999-02-31 1-1-1-1.txt")
+        self.assertEqual(0, len(CachedTime.PARSE_CACHE))
+
+        parsed = Cached.parse(first)
+        self.assertEqual((first, Cached(first).values), (parsed.name, parsed.values))
+        parsed.version = 7  # not shared with the prototype or cache
+        self.assertEqual(('1', ''), (Cached.parse(first).version, Cached._prototype(None).name))
+        self.assertEqual(underscored.name, Cached.parse(underscored.name, sep='_').name)
+        with self.assertRaises(ValueError):
+            Cached.parse('not.valid')
+
+
+    def test_default_cache(self):
+        class Cached(UsdAsset):
+            pass
+
+        first = Cached.get_default()
+        first.area = 'model'
+        second = Cached.get_default(version=3)
+        self.assertEqual(('rnd', '3'), (second.area, second.version))
+        self.assertEqual(UsdAsset.get_default(version=3).name, second.name)
+        self.assertEqual('model', first.area)
+        with self.assertRaises(ValueError):
+            Cached.get_default(version='x')
+        self.assertEqual('demo-3d-abc-entity-rnd-main-atom-lead-base-whole.1.usd', Cached.get_default().name)
+        Cached.DEFAULT_SUFFIX = 'usda'
+        self.assertEqual('usda', Cached.get_default().suffix)
+
+        class Plain(DefaultName):
+            config = dict(base=r'\w+')
+
+        self.assertEqual({}, Plain()._defaults)  # defaults of other subclasses are not shared
+
+        Cached.SPLICE_FIELDS = True
+        spliced = Cached.get_default()
+        spliced.version = 4
+        self.assertEqual('demo-3d-abc-entity-rnd-main-atom-lead-base-whole.4.usda', spliced.name)
+
+        self.assertFalse(DateTimeFile.CACHE_DEFAULTS)
+        self.assertNotEqual(DateTimeFile.get_default().name, DateTimeFile.get_default().name)
+
+
 class TestUsdAsset(unittest.TestCase):
     def test_usd_asset(self):
         assetname = UsdAsset.get_anonymous(stream='test', suffix='usdz')
@@ -101,3 +577,464 @@ class TestUsdAsset(unittest.TestCase):
         self.assertEqual(assetname.suffix, 'usdz')
         with self.assertRaises(ValueError):
             UsdAsset.get_anonymous(suffix='xyz')
+
+    def test_anonymous_batch(self):
+        names = UsdAsset.anonymous_batch(50, stream='test', suffix='usdc')
+        self.assertEqual(50, len(names))
+        self.assertEqual(50, len({name.name for name in names}))
+        for name in names:
+            self.assertIsInstance(name, UsdAsset)
+            self.assertEqual(UsdAsset(name.name).values, name.values)
+            self.assertEqual(('test', 'usdc'), (name.stream, name.suffix))
+            self.assertEqual(name.code, name.item)  # UUID fields cycle through all fields, like get_anonymous
+        names[0].area = 'model'  # names don't share state
+        self.assertNotEqual('model', names[1].area)
+        self.assertEqual([], UsdAsset.anonymous_batch(0))
+        with self.assertRaises(ValueError):
+            UsdAsset.anonymous_batch(2, suffix='xyz')
+
+        class Lettered(UsdAsset):
+            config = dict(item='[a-z]+')
+
+        with self.assertRaises(ValueError):
+            Lettered.anonymous_batch(1)
+        self.assertEqual('abc', Lettered.anonymous_batch(1, item='abc')[0].item)
+
+    def test_parse_many(self):
+        valid = UsdAsset.get_default(area='model', version=3).name
+        parsed = UsdAsset.parse_many([valid, 'not-a-valid.name', UsdAsset.get_default(suffix='usdc').name])
+        self.assertEqual([False, True, False], parsed.mask)
+        self.assertEqual(['model', None, 'rnd'], parsed.fields['area'])
+        self.assertEqual(['3', None, '1'], parsed.fields['version'])
+        self.assertEqual(['usd', None, 'usdc'], parsed.fields['suffix'])
+        self.assertEqual(UsdAsset(valid).values, {k: v[0] for k, v in parsed.fields.items() if v[0] is not None})
+
+        dates = ["1999-10-28 22-29-31-926548.txt", "1999-14-28 22-29-31-926548.txt"]
+        self.assertEqual([False, True], DateTimeFile.parse_many(dates).mask)  # same as is_valid
+        self.assertEqual(['10', None], DateTimeFile.parse_many(dates).fields['month'])
+        self.assertEqual(array.array('b', [0, 1]), DateTimeFile.to_columns(dates).mask)
+
+        empty = CGAsset.parse_many([])
+        self.assertEqual([], empty.mask)
+        self.assertEqual([], empty.fields['code'])
+
+    def test_scan(self):
+        root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, root)
+        expected = [UsdAsset.get_default(area=area, version=version) for area in ('model', 'rig') for version in (1, 2)]
+        for name in expected:
+            path = root / name.path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+        misplaced = UsdAsset.get_default(area='anim')
+        (root / expected[0].path.parent / misplaced.name).touch()  # valid name on a wrong directory
+        (root / expected[0].path.parent / 'junk.txt').touch()
+        (root / 'not valid').mkdir()  # pruned, not a valid "code"
+        (root / 'not valid' / expected[0].name).touch()
+
+        expected = sorted(name.name for name in expected)
+        self.assertEqual(expected, sorted(name.name for name in UsdAsset.scan(root)))
+        scanned = list(UsdAsset.scan(str(root), max_workers=4))
+        self.assertEqual(expected, sorted(name.name for name in scanned))
+        self.assertTrue(all(isinstance(name, UsdAsset) for name in scanned))
+        self.assertEqual([], list(UsdAsset.scan(root / 'missing')))
+
+        for area in range(20):  # many branches still queued when the first name is found
+            path = root / UsdAsset.get_default(area=f'area{area}').path
+            path.parent.mkdir(parents=True)
+            path.touch()
+        listed = []
+        list_directory = grill.names._list_directory
+
+        def slow_listing(directory):
+            listed.append(directory)
+            time.sleep(0.005)
+            return list_directory(directory)
+
+        with mock.patch.object(grill.names, '_list_directory', slow_listing):
+            scanning = UsdAsset.scan(root, max_workers=2)
+            next(scanning)
+            scanning.close()
+            at_close = len(listed)
+            time.sleep(0.2)
+        self.assertLessEqual(len(listed), at_close + 2)  # only the ones already running
+
+
+    def test_version_series(self):
+        names = [
+            UsdAsset.get_default(area=area, item=item, version=version, **extra).name
+            for area in ('model', 'rig') for item in ('hero', 'prop') for version in (1, 4, 2, 10)
+            for extra in ({}, dict(output='cache'), dict(suffix='usda'))
+        ]
+        names.append('not.valid')
+        expected = [name for name in names if name.endswith(('.10.usd', '.cache.10.usd', '.10.usda'))]
+        self.assertEqual(expected, UsdAsset.latest(names))
+        self.assertEqual([name.replace('.10.', '.11.') for name in expected], UsdAsset.next_version(iter(names)))
+        self.assertEqual(dict.fromkeys(expected, [3, 5, 6, 7, 8, 9]), UsdAsset.missing_versions(names))
+        self.assertEqual({}, UsdAsset.missing_versions([UsdAsset.get_default(version=v).name for v in (3, 5, 4)]))
+        self.assertEqual([], UsdAsset.latest([]))
+        padded = UsdAsset.get_default(version='009').name
+        self.assertEqual([padded.replace('.009.', '.010.')], UsdAsset.next_version([padded]))
+        underscored = [UsdAsset.get_default(version=v).name.replace('-', '_') for v in (1, 2)]
+        self.assertEqual(underscored[1:], UsdAsset.latest(underscored, sep='_'))
+
+        root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, root)
+        for version in (1, 3):
+            path = root / UsdAsset.get_default(version=version).path
+            path.parent.mkdir(parents=True)
+            path.touch()
+        self.assertEqual([UsdAsset.get_default(version=3).name], UsdAsset.latest(root))
+        self.assertEqual([UsdAsset.get_default(version=4).name], UsdAsset.next_version(str(root)))
+        self.assertEqual({UsdAsset.get_default(version=3).name: [2]}, UsdAsset.missing_versions(root))
+
+    def test_short_names(self):
+        names = [
+            UsdAsset.get_default(area=area, item=item, version=version, **extra).name
+            for area in ('model', 'rig') for item in ('atom', 'prop') for version in (1, 12)
+            for extra in ({}, dict(output='cache', index=3), dict(suffix='usda'))
+        ]
+        self.assertEqual('', UsdAsset.get_default().to_short())
+        self.assertEqual('a=rig,i=prop,output=cache,version=12,index=3', UsdAsset(names[-2]).to_short())
+        encoded = UsdAsset.to_short_many([*names, 'not.valid'])
+        self.assertEqual([UsdAsset(name).to_short() for name in names] + [None], encoded)
+        self.assertEqual(names, UsdAsset.from_short_many(encoded[:-1], validate=True))
+        self.assertEqual(names[-2], UsdAsset.from_short(encoded[-3]).name)
+
+        codes = {}
+        coded = UsdAsset.to_short_many(names, codes)
+        self.assertEqual({'a': ['model', 'rig'], 'i': ['prop'], 'output': ['cache'], 'suffix': ['usda']}, codes)
+        self.assertEqual('a=1,i=0,output=0,version=12,index=3', coded[-2])
+        self.assertEqual(coded, [UsdAsset(name).to_short(codes) for name in names])  # codes are reused
+        self.assertEqual(names, UsdAsset.from_short_many(coded, codes))
+        self.assertEqual(names[-2], UsdAsset.from_short(coded[-2], codes).name)
+        self.assertLess(sum(map(len, coded)), sum(map(len, encoded[:-1])))
+
+        underscored = UsdAsset.get_default(area='model').name.replace('-', '_')
+        self.assertEqual(['a=model'], UsdAsset.to_short_many([underscored], sep='_'))
+        self.assertEqual(underscored, UsdAsset.from_short('a=model', sep='_').name)
+        self.assertEqual('v=shot', CGAsset.get_default(variant='shot').to_short())
+        self.assertEqual(CGAsset.get_default(variant='shot').name, CGAsset.from_short('v=shot').name)
+        for invalid in ('x=1', 'a', 'version=', 'a=9', 'a=-1'):
+            with self.subTest(invalid=invalid), self.assertRaises(ValueError):
+                UsdAsset.from_short(invalid, codes)
+        with self.assertRaises(ValueError):
+            UsdAsset.from_short('a=not-valid')
+
+
+class TestNameIndex(unittest.TestCase):
+    def test_index(self):
+        names = [
+            UsdAsset.get_default(area=area, item=item, version=version).name
+            for area in ('model', 'rig', 'anim') for item in ('hero', 'prop') for version in (1, 2, 5)
+        ]
+        index = NameIndex(UsdAsset)
+        self.assertEqual(['not.valid'], index.update(names + ['not.valid']))
+        self.assertEqual(len(names), len(index))
+        self.assertIn(names[0], index)
+        with self.assertRaises(ValueError):
+            index.add('not.valid')
+
+        expected = {n for n in names if UsdAsset(n).area == 'model' and UsdAsset(n).version == '2'}
+        self.assertEqual(expected, index.query(area='model', version=2))
+        self.assertEqual(set(), index.query(area='missing'))
+        self.assertEqual(set(names), index.query())
+        self.assertEqual({n for n in names if UsdAsset(n).area == 'model'}, index.query_prefix(area='mo'))
+        self.assertEqual({n for n in names if UsdAsset(n).area == 'rig' and UsdAsset(n).item == 'hero'}, index.query_prefix(area='r', item='h'))
+        self.assertEqual(set(), index.query_prefix(area='z'))
+
+        latest = UsdAsset.get_default(area='rig', item='hero', version=5).name
+        self.assertEqual(6, len(index.latest()))
+        self.assertIn(latest, index.latest(area='rig'))
+        index.remove(latest)
+        self.assertNotIn(latest, index)
+        self.assertEqual(
+            {UsdAsset.get_default(area='rig', item='hero', version=2).name, UsdAsset.get_default(area='rig', item='prop', version=5).name},
+            set(index.latest(area='rig')),
+        )
+        index.discard(latest)
+        with self.assertRaises(KeyError):
+            index.remove(latest)
+        index.add(latest)
+        self.assertIn(latest, index.latest(area='rig', item='hero'))
+
+        with self.assertRaises(ValueError):
+            NameIndex(CGAsset, [CGAsset.get_default().name]).latest()
+
+
+class TestAssetResolver(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+        for area, version in (('model', 1), ('model', 3), ('rig', 2)):
+            path = self.root / UsdAsset.get_default(area=area, version=version).path
+            path.parent.mkdir(parents=True)
+            path.touch()
+        (self.root / UsdAsset.get_default(area='model', version=7).path.parent).mkdir()  # empty version
+
+    def _resolve(self, resolver, *names):
+        async def resolve():
+            async with resolver:
+                return await resolver.resolve_many(names)
+
+        return asyncio.run(resolve())
+
+    def test_resolve(self):
+        model, rig = [UsdAsset.get_default(area=area, version=2).name for area in ('model', 'rig')]
+        resolver = AssetResolver(self.root, batch_size=1)
+        found = [self.root / UsdAsset(rig).path, None, self.root / UsdAsset(rig).path]
+        self.assertEqual(found, self._resolve(resolver, rig, model, rig))
+        (self.root / UsdAsset(rig).path).unlink()
+        self.assertEqual(found[:1], self._resolve(resolver, rig))  # cached
+        resolver.clear()
+        self.assertEqual([None], self._resolve(resolver, rig))
+        self.assertEqual(
+            [self.root / UsdAsset.get_default(area='model', version=3).path, None],
+            self._resolve(AssetResolver(str(self.root), latest=True), model, rig),
+        )
+        with self.assertRaises(NameValidationError):
+            self._resolve(resolver, model, 'not valid')
+
+    def test_dedup_and_ttl(self):
+        checked = []
+
+        class Counting(AssetResolver):
+            def _find_all(self, targets):
+                checked.extend(targets)
+                return super()._find_all(targets)
+
+        name = UsdAsset.get_default(area='model', version=1).name
+        resolver = Counting(self.root, ttl=0)
+
+        async def resolve():
+            async with resolver:
+                first, second = await asyncio.gather(resolver.resolve_many([name, name]), resolver.resolve(name))
+                third = await resolver.resolve(name)  # expired
+                return first, second, third
+
+        path = self.root / UsdAsset(name).path
+        self.assertEqual(([path, path], path, path), asyncio.run(resolve()))
+        self.assertEqual(2, len(checked))
+
+
+class TestThreadSafety(unittest.TestCase):
+    threads = 8
+
+    def setUp(self):
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # interleave threads as much as possible
+        self.addCleanup(sys.setswitchinterval, interval)
+
+    def _run(self, function, *args):
+        barrier = threading.Barrier(self.threads)
+
+        def start(*args):
+            barrier.wait()
+            return function(*args)
+
+        with futures.ThreadPoolExecutor(self.threads) as executor:
+            return list(executor.map(start, *args))
+
+    def test_concurrent_conventions(self):
+        for __ in range(20):
+            class Fresh(UsdAsset):  # solves its configs and convention on first use
+                file_config = naming.NameConfig(dict(suffix='usd|usda'))
+
+            names = self._run(lambda area: Fresh.get_default(area=area).name, [f'area{i}' for i in range(self.threads)])
+            self.assertEqual([UsdAsset.get_default(area=f'area{i}').name for i in range(self.threads)], names)
+
+    def test_reload_while_parsing(self):
+        # reloaded configs are published at once: concurrent parsing never sees a partially solved convention
+        name = UsdAsset.get_default(area='model').name
+        done = threading.Event()
+
+        def reload():
+            while not done.is_set():
+                grill.names._reload_token_configs(frozenset({'CGAsset'}))
+
+        reloader = threading.Thread(target=reload)
+        reloader.start()
+        try:
+            parsed = self._run(lambda __: [UsdAsset(name).area for __ in range(1000)], range(self.threads))
+        finally:
+            done.set()
+            reloader.join()
+        self.assertEqual([['model'] * 1000] * self.threads, parsed)
+
+    def test_shared_compounds(self):
+        # concurrent first solves of other configs may replace the compounds tracked on the class while solving
+        class Fresh(UsdAsset):
+            file_config = naming.NameConfig(dict(suffix='usd|usda'))
+
+        Fresh.get_default()
+        Fresh._uc = types.MappingProxyType({})
+        del grill.names._CONVENTIONS[Fresh]
+        self.assertEqual(UsdAsset.get_default().name, Fresh.get_default().name)
+
+    def test_concurrent_parsing(self):
+        proto = UsdAsset.get_default()
+        chunks = [[proto.get(item=f'item{t}x{i}', version=i + 1) for i in range(200)] for t in range(self.threads)]
+        expected = [UsdAsset.parse_many(chunk) for chunk in chunks]
+        self.assertEqual(expected, self._run(UsdAsset.parse_many, chunks))
+        self.assertEqual(
+            [[UsdAsset(name).values for name in chunk] for chunk in chunks],
+            self._run(lambda chunk: [UsdAsset(name).values for name in chunk], chunks),
+        )
+        anonymous = self._run(lambda n: UsdAsset.anonymous_batch(n), [100] * self.threads)
+        self.assertEqual(100 * self.threads, len({name.name for batch in anonymous for name in batch}))
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        grill.names.metrics(reset=True)
+        self.addCleanup(grill.names.metrics, reset=True)
+        self.addCleanup(grill.names.disable_metrics)
+
+    def test_disabled(self):
+        owners = (DefaultName, DefaultFile, grill.names._FieldValue, grill.names._DateTimeField)
+        members = {owner: dict(vars(owner)) for owner in owners}
+        grill.names.enable_metrics()
+        grill.names.enable_metrics()  # enabling again keeps the original members to restore
+        self.assertIsNot(members[DefaultName]['name'], vars(DefaultName)['name'])
+        grill.names.disable_metrics()
+        self.assertEqual(members, {owner: dict(vars(owner)) for owner in owners})
+        UsdAsset.get_default().path
+        self.assertEqual({}, grill.names.metrics())
+
+    def test_metrics(self):
+        events = []
+
+        def callback(*event):
+            events.append(event)
+            UsdAsset.get_default()  # not measured
+
+        grill.names.enable_metrics(callback)
+        name = UsdAsset.get_default(area='model')
+        self.assertEqual('model', name.area)
+        self.assertEqual(UsdAsset.get_default().get(area='model'), name.name)
+        self.assertEqual('model', name.path.parts[4])
+        with self.assertRaises(NameValidationError):
+            name.name = 'invalid'
+        with self.assertRaises(ValueError):
+            DateTimeFile("1999-02-31 1-1-1-1.txt")
+        CGAsset('demo-3d-abc-entity-model-main-atom-lead-base-whole')
+        LifeTR().get()  # not a DefaultName
+
+        snapshot = grill.names.metrics(reset=True)
+        self.assertEqual({}, grill.names.metrics())
+        self.assertEqual({'UsdAsset', 'DateTimeFile', 'CGAsset'}, snapshot.keys())
+        usd = snapshot['UsdAsset']
+        self.assertEqual(
+            {'get_default': (2, 0), 'get': (1, 0), 'path': (1, 0), 'parse': (1, 1)},
+            {operation: (stats['count'], stats['errors']) for operation, stats in usd.items()},
+        )
+        self.assertEqual({'parse': (1, 1)}, {k: (v['count'], v['errors']) for k, v in snapshot['DateTimeFile'].items()})
+        self.assertEqual({'parse': (1, 0)}, {k: (v['count'], v['errors']) for k, v in snapshot['CGAsset'].items()})
+        for stats in usd.values():
+            self.assertEqual(stats['count'], sum(stats['histogram'].values()))
+            self.assertGreater(stats['seconds'], 0)
+        self.assertEqual(7, len(events))
+        self.assertEqual(('UsdAsset', 'get_default', False), events[0][:2] + events[0][3:])
+        self.assertEqual(('UsdAsset', 'parse', True), events[-3][:2] + events[-3][3:])
+
+        grill.names.disable_metrics()
+        UsdAsset.get_default()
+        self.assertEqual({}, grill.names.metrics())
+
+    def test_field_sets(self):
+        name, timed = UsdAsset.get_default(), DateTimeFile.get_default()
+        grill.names.enable_metrics()
+        name.area = 'model'
+        for field, value in (('suffix', 'abc'), ('version', 'x')):
+            with self.subTest(field=field), self.assertRaises(NameValidationError):
+                setattr(name, field, value)
+        with self.assertRaises(ValueError):
+            timed.month = 14
+        snapshot = grill.names.metrics()
+        self.assertEqual({'set': (3, 2)}, {k: (v['count'], v['errors']) for k, v in snapshot['UsdAsset'].items()})
+        self.assertEqual({'set': (1, 1)}, {k: (v['count'], v['errors']) for k, v in snapshot['DateTimeFile'].items()})
+
+
+class TestCLI(unittest.TestCase):
+    def test_validate(self):
+        from grill.names import __main__ as cli
+        valid = UsdAsset.get_default(area='model')
+        lines = [valid.name, 'not-a-valid.name', f'/mnt/{valid.path.as_posix()}', f'/mnt/wrong/{valid.name}']
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        names_path = os.path.join(tempdir, 'names.txt')
+        with open(names_path, 'w') as names_file:
+            names_file.write('\n'.join(lines))
+
+        def run(*args):
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                exit_code = cli.main(['validate', '--type', 'UsdAsset', names_path, *args])
+            return exit_code, [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+        exit_code, results = run('--workers', '0')
+        self.assertEqual(1, exit_code)
+        self.assertEqual(lines, [result['input'] for result in results])
+        self.assertEqual([True, False, False, False], [result['valid'] for result in results])
+        self.assertEqual(valid.values, results[0]['fields'])
+
+        exit_code, results = run('--paths', '--errors-only', '--workers', '2', '--chunk-size', '1')
+        self.assertEqual(1, exit_code)
+        self.assertEqual([lines[0], lines[1], lines[3]], [result['input'] for result in results])
+        self.assertIn(str(valid.path), results[0]['error'])
+
+        completed = subprocess.run(
+            [sys.executable, '-m', 'grill.names', 'validate', '--type', 'DateTimeFile', '--workers', '0'],
+            input="1999-10-28 22-29-31-926548.txt\n1999-14-28 22-29-31-926548.txt\n", capture_output=True, text=True,
+        )
+        self.assertEqual(1, completed.returncode)
+        results = [json.loads(line) for line in completed.stdout.splitlines()]
+        self.assertEqual('10', results[0]['fields']['month'])
+        self.assertEqual('month must be in 1..12', results[1]['error'])
+
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            self.assertEqual(0, cli.main(['validate', '--workers', '0', os.devnull]))
+        self.assertEqual('', stdout.getvalue())
+
+    def test_validate_types(self):
+        from grill.names import __main__ as cli
+        valid = {
+            'CGAsset': CGAsset.get_default().name,
+            'CGAssetFile': CGAssetFile.get_default().name,
+            'UsdAsset': UsdAsset.get_default().name,
+            'DateTimeFile': "1999-10-28 22-29-31-926548.txt",
+            'LifeTR': 'Eukaryota:Animalia:Chordata:Mammalia:Carnivora:Felidae:Panthera:P. leo:leo',
+        }
+        self.assertEqual(valid.keys(), cli._TYPES.keys())
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        for type_name, name in valid.items():
+            with self.subTest(type=type_name):
+                names_path = os.path.join(tempdir, f'{type_name}.txt')
+                with open(names_path, 'w') as names_file:
+                    names_file.write(f'{name}\nnot valid\n')
+                stdout = io.StringIO()
+                with contextlib.redirect_stdout(stdout):
+                    exit_code = cli.main(['validate', '--type', type_name, '--workers', '0', names_path])
+                self.assertEqual(1, exit_code)
+                results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+                self.assertEqual([True, False], [result['valid'] for result in results])
+
+
+class TestImport(unittest.TestCase):
+    def test_import_time(self):
+        # -X importtime reports every module imported (with its cost) on stderr
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import grill.names'],
+            capture_output=True, text=True, check=True,
+        )
+        imported = {line.rsplit('|', 1)[-1].strip() for line in result.stderr.splitlines() if line.startswith('import time:')}
+        self.assertIn('grill.names', imported)
+        # USD plugins, uuid and entry points are solved on first use only
+        self.assertFalse({'pxr', 'uuid', 'importlib.metadata'}.intersection(imported))
+
+    def test_lazy_docs(self):
+        self.assertIn('Highest classification level', CGAsset.__doc__)
+        self.assertIn('Prokaryota', LifeTR.__doc__)
+        self.assertIs(CGAsset.__doc__, CGAsset().__doc__)
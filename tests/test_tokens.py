@@ -1,4 +1,11 @@
+import os
+import sys
+import shutil
+import queue
 import unittest
+import tempfile
+import threading
+from concurrent import futures
 from grill.tokens import ids
 
 
@@ -13,3 +20,135 @@ class TestIDs(unittest.TestCase):
     def test_mod(self):
         with self.assertRaises(AttributeError):
             ids.hello
+
+    def test_cache(self):
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        cfg_path = os.path.join(tempdir, 'Tokens.cfg')
+        with open(cfg_path, 'w') as cfg:
+            cfg.write("[first]\nshort_name = f\ndescription = First token.\n")
+
+        sections = ids._load_sections(cfg_path)
+        self.assertEqual((('first', (('short_name', 'f'), ('description', 'First token.'))),), sections)
+        cache_path = ids._cache_path(cfg_path)
+        self.assertTrue(os.path.isfile(cache_path))
+        self.assertEqual(sections, ids._load_sections(cfg_path))
+
+        # same contents with a new mtime keep the cached sections
+        stat = os.stat(cfg_path)
+        os.utime(cfg_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(sections, ids._load_sections(cfg_path))
+
+        # source of truth is the cfg file
+        with open(cfg_path, 'a') as cfg:
+            cfg.write("[second]\nshort_name = s\ndescription = Second token.\npattern = \\d+\n")
+        stat = os.stat(cfg_path)
+        os.utime(cfg_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+        self.assertEqual(['first', 'second'], [s for s, __ in ids._load_sections(cfg_path)])
+
+        # corrupt caches are ignored and replaced
+        with open(cache_path, 'wb') as cache:
+            cache.write(b'not marshal')
+        self.assertEqual(['first', 'second'], [s for s, __ in ids._load_sections(cfg_path)])
+
+    def test_search_paths(self):
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        cfg_path = os.path.join(tempdir, 'Studio.cfg')
+
+        def write(contents, offset):
+            with open(cfg_path, 'w') as cfg:
+                cfg.write(contents)
+            stat = os.stat(cfg_path)  # ensure a different mtime on coarse filesystems
+            os.utime(cfg_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset * 10 ** 9))
+
+        write("[show]\nshort_name = sh\ndescription = Show.\n", 1)
+        notified = []
+        ids.subscribe(notified.append)
+        self.addCleanup(ids._subscribers.remove, notified.append)
+
+        with self.assertRaises(AttributeError):
+            ids.Studio
+        ids.add_search_path(tempdir)
+        self.assertIn('Studio', dir(ids))
+        studio = ids.Studio
+        self.assertEqual(['show'], [t.name for t in studio])
+        self.assertEqual(frozenset(), ids.refresh())
+
+        write("[show]\nshort_name = sh\ndescription = Show.\n[shot]\nshort_name = st\ndescription = Shot.\n", 2)
+        self.assertIs(studio, ids.Studio)  # no I/O until refreshed
+        self.assertEqual(frozenset({'Studio'}), ids.refresh())
+        self.assertEqual(['show', 'shot'], [t.name for t in ids.Studio])
+        self.assertEqual([frozenset({'Studio'})], notified)
+
+        write("[broken", 3)  # invalid contents keep previous tokens
+        self.assertEqual(frozenset(), ids.refresh())
+        self.assertEqual(['show', 'shot'], [t.name for t in ids.Studio])
+
+        ids.remove_search_path(tempdir)
+        with self.assertRaises(AttributeError):
+            ids.Studio
+
+    def test_watch(self):
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        cfg_path = os.path.join(tempdir, 'Watched.cfg')
+        with open(cfg_path, 'w') as cfg:
+            cfg.write("[first]\nshort_name = f\ndescription = First.\n")
+        ids.add_search_path(tempdir)
+        self.addCleanup(ids.remove_search_path, tempdir)
+        self.assertEqual(['first'], [t.name for t in ids.Watched])
+
+        notified = queue.Queue()
+        callback = lambda changed: notified.put((changed, threading.current_thread()))
+        ids.subscribe(callback)
+        self.addCleanup(ids._subscribers.remove, callback)
+
+        before = set(threading.enumerate())
+        stop = ids.watch(0.01)
+        self.addCleanup(stop.set)
+        watcher, = set(threading.enumerate()) - before
+
+        with open(cfg_path, 'w') as cfg:
+            cfg.write("[first]\nshort_name = f\ndescription = First.\n[second]\nshort_name = s\ndescription = Second.\n")
+        stat = os.stat(cfg_path)  # ensure a different mtime on coarse filesystems
+        os.utime(cfg_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        changed, thread = notified.get(timeout=5)
+        self.assertEqual(frozenset({'Watched'}), changed)
+        self.assertIs(watcher, thread)
+        self.assertEqual(['first', 'second'], [t.name for t in ids.Watched])
+
+        stop.set()
+        watcher.join(timeout=5)
+        self.assertFalse(watcher.is_alive())
+
+    def test_entry_points(self):
+        before = list(ids._search_paths)
+        ids.add_entry_point_paths('grill.tokens.ids.test.missing')
+        self.assertEqual(before, ids._search_paths)
+
+    def test_concurrent_load(self):
+        tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tempdir)
+        names = [f'Concurrent{i}' for i in range(5)]
+        for name in names:
+            with open(os.path.join(tempdir, f'{name}.cfg'), 'w') as cfg:
+                cfg.write("[token]\nshort_name = t\ndescription = Token.\n")
+        ids.add_search_path(tempdir)
+        self.addCleanup(ids.remove_search_path, tempdir)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+        threads = 8
+        for name in names:  # concurrent first lookups of the same tokens get a single enum
+            barrier = threading.Barrier(threads)
+
+            def load():
+                barrier.wait()
+                return getattr(ids, name)
+
+            with futures.ThreadPoolExecutor(threads) as executor:
+                loaded = [executor.submit(load) for __ in range(threads)]
+            self.assertEqual(1, len({id(future.result()) for future in loaded}))
+            self.assertIs(getattr(ids, name), loaded[0].result())